@@ -13,24 +13,33 @@ GET  /health       — Health check
 from __future__ import annotations
 
 import asyncio
-import hashlib
+import functools
+import logging
 import re
 import time
 import uuid
+from collections import Counter
 from contextlib import asynccontextmanager
-from typing import Optional
+from datetime import datetime, timezone, timedelta
+from types import MappingProxyType
+from typing import AsyncIterator, Optional
 
 from fastapi import FastAPI, HTTPException, Query, Depends, Header
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse, RedirectResponse
+from fastapi.responses import (
+    JSONResponse, FileResponse, RedirectResponse, Response, StreamingResponse,
+)
 from fastapi.staticfiles import StaticFiles
 from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from pathlib import Path
 
 import os
 
+import orjson
+
 from biasclear.config import settings, APP_VERSION
-from biasclear.frozen_core import CORE_VERSION
+from biasclear.frozen_core import CORE_VERSION, frozen_core
 
 # Track startup time for uptime reporting
 _STARTUP_TIME = time.time()
@@ -40,17 +49,19 @@ _llm_last_success: float = 0.0
 from biasclear.audit import audit_chain
 from biasclear.detector import scan_local, scan_deep, scan_full
 from biasclear.corrector import correct_bias
+from biasclear.certificate import generate_certificate_html, compute_certificate_id
 from biasclear.patterns.learned import learning_ring
 from biasclear.llm.factory import get_provider_with_fallback
 from biasclear.auth import require_api_key, AUTH_ENABLED
-from biasclear.rate_limit import check_rate_limit
+from biasclear.rate_limit import enforce_rate_limit
+from biasclear.rate_limit_redis import close_redis_limiter
 from biasclear.cache import scan_cache
-from biasclear.llm import CircuitOpenError
+from biasclear.llm import CircuitOpenError, get_llm_executor, shutdown_llm_executor
 from biasclear.playground_token import (
     create_playground_token,
     validate_playground_token,
 )
-from biasclear.logging import setup_logging, get_logger
+from biasclear.logging import setup_logging, shutdown_logging, get_logger
 from biasclear.signups import signup_store
 from biasclear.schemas.scan import (
     ScanRequest,
@@ -86,20 +97,32 @@ def _get_client_ip(request: Request) -> str:
     return request.client.host if request.client else "0.0.0.0"
 
 
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson.
+
+    Routes with a response_model are already serialized straight to bytes
+    by Pydantic; this covers explicit JSONResponse returns and model-less
+    routes, which would otherwise go through stdlib json.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 # ============================================================
 # STARTUP / SHUTDOWN
 # ============================================================
 
 async def _cleanup_loop():
-    """Background task: purge expired tokens and stale rate-limit windows every 5 minutes."""
+    """Background task: purge expired tokens and stale rate-limit buckets every 5 minutes."""
     from biasclear.playground_token import cleanup_expired_tokens
-    from biasclear.rate_limit import cleanup_stale_windows
+    from biasclear.rate_limit import cleanup_stale_buckets
 
     while True:
         await asyncio.sleep(300)  # 5 minutes
         try:
             tokens_removed = cleanup_expired_tokens()
-            cleanup_stale_windows(max_age=7200)
+            cleanup_stale_buckets(max_age=7200)
             if tokens_removed:
                 logger.debug("Cleanup: removed %d expired tokens", tokens_removed)
         except Exception:
@@ -168,7 +191,9 @@ async def lifespan(app: FastAPI):
         logger.info("Bedrock provider configured (region=%s, model=%s)",
                     settings.AWS_REGION, settings.BEDROCK_MODEL_ID)
 
-    learning_ring.set_audit_logger(audit_chain.log)
+    # Learning-ring transitions happen on the event loop mid-scan; the
+    # queued variant returns the final hash without waiting on the commit
+    learning_ring.set_audit_logger(audit_chain.log_async)
 
     # Start background cleanup for expired tokens and stale rate-limit windows
     cleanup_task = asyncio.create_task(_cleanup_loop())
@@ -182,6 +207,8 @@ async def lifespan(app: FastAPI):
     global _llm_last_success
     try:
         provider = _get_llm()
+        # Build the SDK client now rather than on the first user request
+        await asyncio.get_running_loop().run_in_executor(get_llm_executor(), provider.warm_up)
         probe_result = await provider.generate(
             prompt="Respond with exactly: OK",
             temperature=0.0,
@@ -203,7 +230,14 @@ async def lifespan(app: FastAPI):
     yield
     cleanup_task.cancel()
     canary_task.cancel()
+    shutdown_llm_executor()
+    audit_chain.flush(timeout=30)
+    audit_chain.close_connections()
+    learning_ring.flush_evaluations()
+    learning_ring.close_connections()
+    await close_redis_limiter()
     logger.info("BiasClear API shutting down")
+    shutdown_logging()
 
 
 # OpenAPI docs lockdown — disabled in production unless explicitly enabled
@@ -237,9 +271,25 @@ app = FastAPI(
 )
 
 # CORS — set BIASCLEAR_CORS_ORIGINS in production (e.g. "https://biasclear.com")
+def _parse_cors_origins(raw: str) -> tuple[frozenset[str], Optional[str]]:
+    """Split the origins setting into exact origins and one wildcard regex.
+
+    Exact origins become a frozenset, giving Starlette's per-request
+    ``origin in allow_origins`` an O(1) lookup. Subdomain wildcards such
+    as ``https://*.biasclear.com`` are compiled into a single
+    ``allow_origin_regex`` instead of silently never matching.
+    """
+    entries = {o.strip() for o in raw.split(",") if o.strip()}
+    wildcards = sorted(o for o in entries if "*" in o and o != "*")
+    regex = "|".join(re.escape(o).replace(r"\*", "[^./]+") for o in wildcards)
+    return frozenset(entries.difference(wildcards)), regex or None
+
+
+_CORS_ORIGINS, _CORS_ORIGIN_REGEX = _parse_cors_origins(settings.CORS_ORIGINS)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[o.strip() for o in settings.CORS_ORIGINS.split(",")],
+    allow_origins=_CORS_ORIGINS,
+    allow_origin_regex=_CORS_ORIGIN_REGEX,
     allow_methods=["GET", "POST", "OPTIONS"],
     allow_headers=["X-API-Key", "Content-Type", "Authorization"],
     allow_credentials=False,
@@ -257,7 +307,7 @@ async def root():
     index = _static_dir / "index.html"
     if index.exists():
         return FileResponse(str(index), media_type="text/html")
-    return JSONResponse({"message": "BiasClear API", "docs": "/docs"})
+    return ORJSONResponse({"message": "BiasClear API", "docs": "/docs"})
 
 
 @app.get("/privacy", include_in_schema=False)
@@ -266,7 +316,7 @@ async def privacy():
     page = _static_dir / "privacy.html"
     if page.exists():
         return FileResponse(str(page), media_type="text/html")
-    return JSONResponse({"message": "Privacy policy unavailable"}, status_code=404)
+    return ORJSONResponse({"message": "Privacy policy unavailable"}, status_code=404)
 
 
 @app.get("/demo", include_in_schema=False)
@@ -290,9 +340,9 @@ async def beta_signup(request: Request):
             parsed = parse_qs(raw)
             email = parsed.get("email", [""])[0].strip().lower()
         if not email or "@" not in email:
-            return JSONResponse({"status": "error", "message": "Invalid email"}, status_code=400)
+            return ORJSONResponse({"status": "error", "message": "Invalid email"}, status_code=400)
         signup = signup_store.add(email, source="website")
-        audit_chain.log(
+        audit_chain.submit(
             event_type="beta_signup",
             data={
                 "email_sha256": signup["email_sha256"],
@@ -308,16 +358,19 @@ async def beta_signup(request: Request):
                 "email_sha256": signup["email_sha256"],
             },
         )
-        return JSONResponse({"status": "ok", "message": "Signup recorded"})
+        return ORJSONResponse({"status": "ok", "message": "Signup recorded"})
     except Exception:
         logger.error("Beta signup failed", exc_info=True)
-        return JSONResponse(
+        return ORJSONResponse(
             {"status": "error", "message": "Signup could not be recorded"},
             status_code=500,
         )
 
 
-@app.get("/beta-signups", include_in_schema=False)
+_legacy_signups_backfilled = False
+
+
+@app.get("/beta-signups", include_in_schema=False, response_class=ORJSONResponse)
 async def get_beta_signups(
     key_id: Optional[str] = Depends(require_api_key),
 ):
@@ -328,11 +381,17 @@ async def get_beta_signups(
         raise HTTPException(status_code=403, detail="Endpoint requires authentication to be enabled.")
     # Backfill historical signups that were stored in the audit chain before
     # privacy hardening moved raw emails into the dedicated signup store.
-    legacy_entries = audit_chain.get_recent(limit=500, event_type="beta_signup")
-    for entry in legacy_entries:
-        legacy_email = entry["data"].get("email")
-        if legacy_email:
-            signup_store.add(legacy_email, source=entry["data"].get("source", "website"))
+    # New entries never carry raw emails, so once per process is enough.
+    global _legacy_signups_backfilled
+    if not _legacy_signups_backfilled:
+        legacy_entries = await asyncio.to_thread(
+            audit_chain.get_recent,
+            limit=500, event_type="beta_signup", fields=("email", "source"),
+        )
+        for legacy_email, source in legacy_entries:
+            if legacy_email:
+                signup_store.add(legacy_email, source=source or "website")
+        _legacy_signups_backfilled = True
 
     emails = signup_store.get_recent(limit=500)
     return {"total": len(emails), "signups": emails}
@@ -350,7 +409,7 @@ async def global_error_handler(request: Request, exc: Exception):
         extra={"error": str(exc), "path": request.url.path, "method": request.method},
         exc_info=True,
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "detail": "Internal server error. The scan could not be completed.",
@@ -358,22 +417,18 @@ async def global_error_handler(request: Request, exc: Exception):
     )
 
 
-# Lazy LLM provider
-_llm = None
-
-
+# LLM provider — built once (first call is the startup smoke check in
+# lifespan) and shared. A failed construction isn't cached, so it retries.
+@functools.cache
 def _get_llm():
-    global _llm
-    if _llm is None:
-        _llm = get_provider_with_fallback()
-    return _llm
+    return get_provider_with_fallback()
 
 
 # ============================================================
 # PLAYGROUND TOKEN ENDPOINT
 # ============================================================
 
-@app.get("/playground/token", include_in_schema=False)
+@app.get("/playground/token", include_in_schema=False, response_class=ORJSONResponse)
 async def get_playground_token(request: Request):
     """Issue a short-lived playground session token."""
     ip = _get_client_ip(request)
@@ -424,30 +479,32 @@ async def scan_text(
                 detail="Authentication required. Include X-API-Key header or use the playground.",
             )
 
-    check_rate_limit(key_id, ip=ip)
-    start = time.time()
+    await enforce_rate_limit(key_id, ip=ip)
+    start = time.perf_counter_ns()
 
     learned = learning_ring.get_active_patterns()
-    # Cache key includes learning ring state — hash pattern IDs so any
-    # activation/deactivation invalidates cache (not just count changes)
-    _pattern_ids = sorted(p.id for p in learned)
-    lr_version = hashlib.md5(",".join(_pattern_ids).encode()).hexdigest()[:8] if _pattern_ids else "none"
+    # Cache key includes learning ring state — the version is bumped on
+    # every activation/deactivation, so any change invalidates the cache
+    lr_version = str(learning_ring.version)
 
     # Check cache first — identical scans return instantly
     cached = await scan_cache.get(request.text, request.domain, request.mode, extra=lr_version)
     if cached is not None:
-        duration = int((time.time() - start) * 1000)
-        logger.info(
-            f"Scan cache hit: score={cached.get('truth_score', '?')} mode={request.mode}",
-            extra={
-                "truth_score": cached.get("truth_score"),
-                "scan_mode": request.mode,
-                "domain": request.domain,
-                "duration_ms": duration,
-                "key_id": key_id,
-            },
-        )
-        return cached
+        cached_score, cached_body = cached
+        if logger.isEnabledFor(logging.INFO):
+            duration = (time.perf_counter_ns() - start) // 1_000_000
+            logger.info(
+                f"Scan cache hit: score={cached_score} mode={request.mode}",
+                extra={
+                    "truth_score": cached_score,
+                    "scan_mode": request.mode,
+                    "domain": request.domain,
+                    "duration_ms": duration,
+                    "key_id": key_id,
+                },
+            )
+        # Validated and serialized when cached — skip response_model entirely
+        return Response(content=cached_body, media_type="application/json")
 
     # Circuit breaker: if LLM is down and mode requires it, fall back to local
     try:
@@ -458,6 +515,7 @@ async def scan_text(
         elif request.mode == "deep":
             result = await scan_deep(
                 request.text, llm=_get_llm(), domain=request.domain,
+                external_patterns=learned,
                 learning_ring=learning_ring, audit_chain=audit_chain,
             )
         elif request.mode == "full":
@@ -513,7 +571,7 @@ async def scan_text(
     except Exception:
         pass
 
-    audit_hash = audit_chain.log(
+    audit_hash = audit_chain.log_async(
         event_type=f"scan_{request.mode}",
         data={
             "truth_score": result["truth_score"],
@@ -534,44 +592,58 @@ async def scan_text(
 
     # Store in cache — but NEVER cache degraded results. When the LLM recovers,
     # users should get full-quality results, not stale local-only fallbacks.
+    # The entry is the validated, serialized response body (plus the score
+    # for hit logging), so hits never re-run ScanResponse validation.
     if not result.get("degraded"):
-        await scan_cache.put(request.text, request.domain, request.mode, result, extra=lr_version)
+        body = ScanResponse.model_validate(result).model_dump_json().encode()
+        await scan_cache.put(
+            request.text, request.domain, request.mode,
+            (result["truth_score"], body), extra=lr_version,
+        )
 
-    duration = int((time.time() - start) * 1000)
-    logger.info(
-        f"Scan complete: score={result['truth_score']} mode={request.mode}",
-        extra={
-            "truth_score": result["truth_score"],
-            "scan_mode": request.mode,
-            "domain": request.domain,
-            "flags_count": len(result["flags"]),
-            "duration_ms": duration,
-            "key_id": key_id,
-        },
-    )
+    if logger.isEnabledFor(logging.INFO):
+        duration = (time.perf_counter_ns() - start) // 1_000_000
+        logger.info(
+            f"Scan complete: score={result['truth_score']} mode={request.mode}",
+            extra={
+                "truth_score": result["truth_score"],
+                "scan_mode": request.mode,
+                "domain": request.domain,
+                "flags_count": len(result["flags"]),
+                "duration_ms": duration,
+                "key_id": key_id,
+            },
+        )
 
     return result
 
 
-@app.post("/scan/batch", response_model=ScanBatchResponse, tags=["Scan"])
-async def scan_batch(
-    request: ScanBatchRequest,
-    raw_request: Request,
-    key_id: Optional[str] = Depends(require_api_key),
-):
-    """Batch scan up to 50 texts concurrently with concurrency cap.
+_BatchKey = tuple[str, str, str]
 
-    Each item is scanned independently. Failed items return a placeholder
-    result with `scan_mode: "error"` rather than failing the entire batch.
-    Batch scan requires an API key — playground tokens are not accepted.
-    """
+
+async def _authorize_batch(
+    request: ScanBatchRequest, raw_request: Request, key_id: Optional[str],
+) -> None:
     if key_id is None and AUTH_ENABLED:
         raise HTTPException(401, "Batch scan requires an API key.")
     if len(request.items) > 50:
         raise HTTPException(400, "Batch scan limited to 50 items per request.")
     ip = _get_client_ip(raw_request)
-    check_rate_limit(key_id, ip=ip)
+    await enforce_rate_limit(key_id, ip=ip)
+
 
+def _batch_key(item: ScanRequest) -> _BatchKey:
+    return (item.text, item.domain, item.mode)
+
+
+async def _run_batch(
+    items: list[ScanRequest],
+) -> AsyncIterator[tuple[_BatchKey, Optional[dict]]]:
+    """Scan each distinct (text, domain, mode) once, yielding results as they land.
+
+    Yields (key, result); result is None when that item failed. Callers
+    scatter each result back to every input position with that key.
+    """
     learned = learning_ring.get_active_patterns()
 
     async def _scan_one(item: ScanRequest) -> dict:
@@ -583,6 +655,7 @@ async def scan_batch(
             elif item.mode == "deep":
                 return await scan_deep(
                     item.text, llm=_get_llm(), domain=item.domain,
+                    external_patterns=learned,
                     learning_ring=learning_ring, audit_chain=audit_chain,
                 )
             else:
@@ -609,69 +682,146 @@ async def scan_batch(
                 result["truth_score"] = 85
             return result
 
-    # Concurrency cap: max 10 concurrent LLM calls to prevent overload
-    _batch_semaphore = asyncio.Semaphore(10)
+    # Concurrency cap on LLM-backed items to prevent upstream overload.
+    # Local items never touch the LLM, so they don't take a slot.
+    _batch_semaphore = asyncio.Semaphore(settings.BATCH_MAX_CONCURRENCY)
 
     async def _scan_one_limited(item: ScanRequest) -> dict:
+        if item.mode == "local":
+            return await _scan_one(item)
         async with _batch_semaphore:
             return await _scan_one(item)
 
-    results = await asyncio.gather(
-        *[_scan_one_limited(item) for item in request.items],
-        return_exceptions=True,
-    )
+    unique: dict[_BatchKey, ScanRequest] = {}
+    for item in items:
+        unique.setdefault(_batch_key(item), item)
+
+    async def _scan_keyed(key: _BatchKey, item: ScanRequest):
+        try:
+            return key, await _scan_one_limited(item)
+        except Exception as e:
+            return key, e
 
-    successful = [r for r in results if isinstance(r, dict)]
-    audit_chain.log(
+    tasks = [asyncio.ensure_future(_scan_keyed(key, item)) for key, item in unique.items()]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            key, r = await next_done
+            if not isinstance(r, dict):
+                logger.warning(
+                    "Batch scan item failed",
+                    extra={"error": str(r), "error_type": type(r).__name__},
+                )
+                r = None
+            yield key, r
+    finally:
+        # A streaming client that disconnects mid-batch leaves nothing to scan for
+        for task in tasks:
+            task.cancel()
+
+
+# Failed batch items all get this same placeholder, built once. It is
+# read-only and shared by every failed position in every response.
+_BATCH_ERROR_RESULT = MappingProxyType({
+    "text": "",
+    "truth_score": 0,
+    "knowledge_type": "unknown",
+    "bias_detected": False,
+    "bias_types": (),
+    "pit_tier": "none",
+    "pit_detail": "",
+    "severity": "none",
+    "confidence": 0.0,
+    "explanation": "Scan failed for this item.",
+    "flags": (),
+    "impact_projection": None,
+    "scan_mode": "error",
+    "source": "error",
+    "core_version": CORE_VERSION,
+})
+_BATCH_ERROR_JSON = ScanResponse.model_validate(_BATCH_ERROR_RESULT).model_dump_json().encode()
+
+
+def _record_batch(key_id: Optional[str], total: int, scanned: int) -> None:
+    audit_chain.submit(
         event_type="scan_batch",
         data={
-            "total": len(request.items),
-            "scanned": len(successful),
-            "errors": len(results) - len(successful),
+            "total": total,
+            "scanned": scanned,
+            "errors": total - scanned,
             "key_id": key_id,
         },
         core_version=CORE_VERSION,
     )
-
-    clean_results = []
-    for r in results:
-        if isinstance(r, dict):
-            clean_results.append(r)
-        else:
-            logger.warning(
-                "Batch scan item failed",
-                extra={"error": str(r), "error_type": type(r).__name__},
-            )
-            clean_results.append({
-                "text": "",
-                "truth_score": 0,
-                "knowledge_type": "unknown",
-                "bias_detected": False,
-                "bias_types": [],
-                "pit_tier": "none",
-                "pit_detail": "",
-                "severity": "none",
-                "confidence": 0.0,
-                "explanation": "Scan failed for this item.",
-                "flags": [],
-                "impact_projection": None,
-                "scan_mode": "error",
-                "source": "error",
-                "core_version": CORE_VERSION,
-            })
-
     logger.info(
-        f"Batch complete: {len(successful)}/{len(request.items)} scanned",
+        f"Batch complete: {scanned}/{total} scanned",
         extra={"key_id": key_id},
     )
 
+
+@app.post("/scan/batch", response_model=ScanBatchResponse, tags=["Scan"])
+async def scan_batch(
+    request: ScanBatchRequest,
+    raw_request: Request,
+    key_id: Optional[str] = Depends(require_api_key),
+):
+    """Batch scan up to 50 texts concurrently with concurrency cap.
+
+    Each item is scanned independently. Failed items return a placeholder
+    result with `scan_mode: "error"` rather than failing the entire batch.
+    Batch scan requires an API key — playground tokens are not accepted.
+    """
+    await _authorize_batch(request, raw_request, key_id)
+
+    # Results land in completion order; the key restores input order
+    result_by_key: dict[_BatchKey, Optional[dict]] = {}
+    async for key, r in _run_batch(request.items):
+        result_by_key[key] = r
+    results = [result_by_key[_batch_key(item)] for item in request.items]
+
+    scanned = sum(r is not None for r in results)
+    _record_batch(key_id, len(results), scanned)
+
     return {
-        "results": clean_results,
-        "total": len(request.items),
-        "scanned": len(successful),
+        "results": [r if r is not None else _BATCH_ERROR_RESULT for r in results],
+        "total": len(results),
+        "scanned": scanned,
     }
 
 
+@app.post("/scan/batch/stream", tags=["Scan"])
+async def scan_batch_stream(
+    request: ScanBatchRequest,
+    raw_request: Request,
+    key_id: Optional[str] = Depends(require_api_key),
+):
+    """Batch scan that streams each result as NDJSON the moment it completes.
+
+    Same limits and per-item semantics as /scan/batch, but lines arrive
+    in completion order: each is `{"index": i, "result": ScanResponse}`,
+    with `index` the item's position in the request.
+    """
+    await _authorize_batch(request, raw_request, key_id)
+
+    positions: dict[_BatchKey, list[int]] = {}
+    for i, item in enumerate(request.items):
+        positions.setdefault(_batch_key(item), []).append(i)
+
+    async def _lines() -> AsyncIterator[bytes]:
+        scanned = 0
+        async for key, r in _run_batch(request.items):
+            body = (
+                ScanResponse.model_validate(r).model_dump_json().encode()
+                if r is not None else _BATCH_ERROR_JSON
+            )
+            for i in positions[key]:
+                yield b'{"index":%d,"result":%b}\n' % (i, body)
+            if r is not None:
+                scanned += len(positions[key])
+        _record_batch(key_id, len(request.items), scanned)
+
+    return StreamingResponse(_lines(), media_type="application/x-ndjson")
+
+
 @app.post("/correct", response_model=CorrectResponse, tags=["Correct"])
 async def correct_text(
     request: CorrectRequest,
@@ -702,7 +852,7 @@ async def correct_text(
                 detail="Authentication required. Include X-API-Key header.",
             )
 
-    check_rate_limit(key_id, ip=ip)
+    await enforce_rate_limit(key_id, ip=ip)
 
     result = await correct_bias(
         text=request.text,
@@ -711,7 +861,7 @@ async def correct_text(
         domain=request.domain,
     )
 
-    audit_chain.log(
+    audit_chain.submit(
         event_type="correction",
         data={
             "changes_count": len(result.get("changes_made", [])),
@@ -740,10 +890,7 @@ async def generate_certificate(
     if key_id is None and AUTH_ENABLED:
         raise HTTPException(401, "Certificate generation requires an API key.")
 
-    from datetime import datetime, timezone
-    from biasclear.certificate import generate_certificate_html, compute_certificate_id
-
-    check_rate_limit(key_id)
+    await enforce_rate_limit(key_id)
 
     issued_at = datetime.now(timezone.utc).isoformat()
     certificate_id = compute_certificate_id(request.text, issued_at)
@@ -760,7 +907,7 @@ async def generate_certificate(
         verify_url=verify_url,
     )
 
-    audit_chain.log(
+    audit_chain.submit(
         event_type="certificate_generated",
         data={
             "certificate_id": certificate_id,
@@ -796,20 +943,19 @@ async def verify_certificate(audit_hash: str):
     if not _HEX64_PATTERN.match(audit_hash):
         raise HTTPException(400, "Invalid audit hash format. Expected 64-character hex string.")
 
-    entries = audit_chain.get_recent(limit=500)
-    for entry in entries:
-        if entry["hash"] == audit_hash:
-            return {
-                "verified": True,
-                "audit_hash": audit_hash,
-                "event_type": entry["event_type"],
-                "timestamp": entry["timestamp"],
-                "truth_score": entry["data"].get("truth_score"),
-            }
+    entry = await asyncio.to_thread(audit_chain.get_by_hash, audit_hash)
+    if entry is None:
+        return {
+            "verified": False,
+            "audit_hash": audit_hash,
+        }
 
     return {
-        "verified": False,
+        "verified": True,
         "audit_hash": audit_hash,
+        "event_type": entry["event_type"],
+        "timestamp": entry["timestamp"],
+        "truth_score": entry["data"].get("truth_score"),
     }
 
 
@@ -824,13 +970,15 @@ async def get_audit(
     The audit chain is a SHA-256 hash-linked append-only log of all system events.
     Each entry references the previous entry's hash, creating a tamper-evident chain.
     """
-    entries = audit_chain.get_recent(limit=limit, event_type=event_type)
+    entries = await asyncio.to_thread(
+        audit_chain.get_recent, limit=limit, event_type=event_type,
+    )
     # Strip prev_hash from responses — internal chain detail
     for entry in entries:
         entry.pop("prev_hash", None)
     return {
         "entries": entries,
-        "total_count": audit_chain.get_count(),
+        "total_count": await asyncio.to_thread(audit_chain.get_count),
     }
 
 
@@ -843,10 +991,12 @@ async def verify_audit(
 
     Walks the chain and confirms each entry's hash matches its content
     and links correctly to the previous entry. Returns any broken links found.
+    Truncation and re-chaining are only checked (merkle_checked) when the
+    window reaches the first entry, i.e. limit covers the whole chain.
     """
-    result = audit_chain.verify_chain(limit=limit)
+    result = await asyncio.to_thread(audit_chain.verify_chain, limit=limit)
 
-    audit_chain.log(
+    audit_chain.submit(
         event_type="chain_verified",
         data=result,
         core_version=CORE_VERSION,
@@ -855,6 +1005,42 @@ async def verify_audit(
     return result
 
 
+# Audit counts for /health, refreshed at most once per second. Load
+# balancers poll health at 1Hz+, and COUNT(*) walks the whole index.
+_HEALTH_COUNTS_TTL = 1.0
+_health_counts: tuple[float, int, int] = (0.0, 0, 0)
+
+
+def _audit_counts() -> tuple[int, int]:
+    """(audit_entries, total_scans) — blocking, run it off the event loop."""
+    return audit_chain.get_count(), audit_chain.get_count(event_prefix="scan_")
+
+
+async def _health_audit_counts() -> tuple[int, int]:
+    """Return (audit_entries, total_scans), cached for _HEALTH_COUNTS_TTL."""
+    global _health_counts
+    fetched_at, audit_count, total_scans = _health_counts
+    now = time.monotonic()
+    if not fetched_at or now - fetched_at >= _HEALTH_COUNTS_TTL:
+        audit_count, total_scans = await asyncio.to_thread(_audit_counts)
+        _health_counts = (now, audit_count, total_scans)
+    return audit_count, total_scans
+
+
+# Liveness body never changes — encode it once.
+_LIVE_BODY = orjson.dumps({"status": "operational", "version": APP_VERSION})
+
+
+@app.get("/health/live", tags=["Health"])
+async def health_live():
+    """Liveness probe for load balancers and container health checks.
+
+    Static response — touches no database, cache, or provider. Use
+    /health for the full status report.
+    """
+    return Response(content=_LIVE_BODY, media_type="application/json")
+
+
 @app.get("/health", response_model=HealthResponse, tags=["Health"])
 async def health():
     """Service health check. No authentication required.
@@ -862,10 +1048,8 @@ async def health():
     Returns current version, LLM provider status, learning ring statistics,
     total scans processed, and uptime.
     """
-    all_learned = learning_ring.get_all_patterns()
-    audit_count = audit_chain.get_count()
-
-    total_scans = audit_chain.get_count(event_prefix="scan_")
+    pattern_counts = learning_ring.get_status_counts()
+    audit_count, total_scans = await _health_audit_counts()
 
     # Check LLM availability via circuit breaker state AND recent success
     llm_available = True
@@ -932,14 +1116,14 @@ async def health():
         },
         "audit_entries": 0 if _ON_RENDER else audit_count,
         "total_scans": total_scans,
-        "learned_patterns_active": len([p for p in all_learned if p["status"] == "active"]),
-        "learned_patterns_staging": len([p for p in all_learned if p["status"] == "staging"]),
+        "learned_patterns_active": pattern_counts["active"],
+        "learned_patterns_staging": pattern_counts["staging"],
         "learning_enabled": True,
         "uptime_seconds": int(time.time() - _STARTUP_TIME),
     }
 
 
-@app.get("/stats", tags=["Health"])
+@app.get("/stats", response_class=ORJSONResponse, tags=["Health"])
 async def stats():
     """Public usage statistics. No authentication required.
 
@@ -947,7 +1131,7 @@ async def stats():
     and activity over the last 24 hours. Useful for dashboards and
     investor/grant due diligence.
     """
-    recent = audit_chain.get_recent(limit=500)
+    recent = await asyncio.to_thread(audit_chain.get_recent, limit=500)
 
     # Count scans by mode
     scans = [e for e in recent if e["event_type"].startswith("scan_")]
@@ -991,7 +1175,6 @@ async def stats():
     )[:10]
 
     # 24-hour activity
-    from datetime import datetime, timezone, timedelta
     cutoff_24h = (datetime.now(timezone.utc) - timedelta(hours=24)).isoformat()
     scans_24h = sum(1 for s in scans if s.get("timestamp", "") > cutoff_24h)
     corrections_24h = sum(
@@ -999,9 +1182,8 @@ async def stats():
         if e["event_type"] == "correction" and e.get("timestamp", "") > cutoff_24h
     )
 
-    total_audit = audit_chain.get_count()
-    total_scans_exact = audit_chain.get_count(event_prefix="scan_")
-    all_learned = learning_ring.get_all_patterns()
+    total_audit, total_scans_exact = await asyncio.to_thread(_audit_counts)
+    learned_counts = learning_ring.get_status_counts()
 
     return {
         "total_scans": total_scans_exact,
@@ -1014,15 +1196,15 @@ async def stats():
             "corrections": corrections_24h,
         },
         "learning_ring": {
-            "active": len([p for p in all_learned if p["status"] == "active"]),
-            "staging": len([p for p in all_learned if p["status"] == "staging"]),
-            "total": len(all_learned),
+            "active": learned_counts["active"],
+            "staging": learned_counts["staging"],
+            "total": sum(learned_counts.values()),
         },
         "uptime_seconds": int(time.time() - _STARTUP_TIME),
     }
 
 
-@app.get("/patterns", tags=["Patterns"])
+@app.get("/patterns", response_class=ORJSONResponse, tags=["Patterns"])
 async def get_patterns(
     domain: str = Query("general", pattern="^(general|legal|media|financial|auto)$",
                         description="Domain filter: general, legal, media, financial, or auto (all)."),
@@ -1034,9 +1216,23 @@ async def get_patterns(
     learned patterns (governance-approved expansions). Use `domain=auto`
     to see all patterns across all domains.
     """
-    from biasclear.frozen_core import frozen_core
-    check_rate_limit(key_id)
+    await enforce_rate_limit(key_id)
+
+    # Keyed and rate-limited per client, so only private caches may reuse it
+    return Response(
+        content=_patterns_payload(domain, learning_ring.version),
+        media_type="application/json",
+        headers={"Cache-Control": "private, max-age=5"},
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _patterns_payload(domain: str, ring_version: int) -> bytes:
+    """Serialized /patterns body, memoized per (domain, learning ring version).
 
+    The frozen core never changes at runtime and the learned side is keyed
+    by the ring version, which is bumped on every activation/deactivation.
+    """
     patterns = frozen_core.get_patterns(domain=domain)
     learned = learning_ring.get_active_patterns()
 
@@ -1054,17 +1250,17 @@ async def get_patterns(
         for p in learned
     ]
 
-    return {
+    return orjson.dumps({
         "domain": domain,
         "core_version": CORE_VERSION,
         "frozen_patterns": len(patterns),
         "learned_patterns": len(learned_dicts),
         "total_patterns": len(patterns) + len(learned_dicts),
         "patterns": patterns + learned_dicts,
-    }
+    })
 
 
-@app.get("/patterns/learned", tags=["Patterns"])
+@app.get("/patterns/learned", response_class=ORJSONResponse, tags=["Patterns"])
 async def get_learned_patterns(
     key_id: Optional[str] = Depends(require_api_key),
 ):
@@ -1074,114 +1270,237 @@ async def get_learned_patterns(
     confirmation counts, false positive rates, and activation thresholds.
     """
     all_patterns = learning_ring.get_all_patterns()
-    active = [p for p in all_patterns if p["status"] == "active"]
-    staging = [p for p in all_patterns if p["status"] == "staging"]
-    deactivated = [p for p in all_patterns if p["status"] == "deactivated"]
+    status_counts = Counter(p["status"] for p in all_patterns)
 
     return {
         "core_version": CORE_VERSION,
         "total": len(all_patterns),
-        "active": len(active),
-        "staging": len(staging),
-        "deactivated": len(deactivated),
+        "active": status_counts["active"],
+        "staging": status_counts["staging"],
+        "deactivated": status_counts["deactivated"],
         "activation_threshold": learning_ring.activation_threshold,
         "fp_limit": learning_ring.fp_limit,
         "patterns": all_patterns,
     }
 
 
+# --- Middleware ---
+# All middleware is pure ASGI: BaseHTTPMiddleware (@app.middleware) runs
+# each request in its own task group and re-streams the response body.
+# add_middleware() wraps outward, so registration order is inside-out.
+
+
 # --- Request ID Middleware ---
-@app.middleware("http")
-async def add_request_id(request: Request, call_next):
+class RequestIDMiddleware:
     """Generate a unique request ID for forensic tracing."""
-    request_id = str(uuid.uuid4())
-    request.state.request_id = request_id
-    response = await call_next(request)
-    response.headers["X-Request-ID"] = request_id
-    return response
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith("/static"):
+            await self.app(scope, receive, send)
+            return
+        request_id = str(uuid.uuid4())
+        scope.setdefault("state", {})["request_id"] = request_id
+        header = (b"x-request-id", request_id.encode("latin-1"))
+
+        async def send_with_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), header]
+            await send(message)
+
+        await self.app(scope, receive, send_with_id)
+
+
+app.add_middleware(RequestIDMiddleware)
 
 
 # --- Security + Version Headers Middleware ---
-@app.middleware("http")
-async def add_security_headers(request: Request, call_next):
-    """Add security and version headers to all responses."""
-    response = await call_next(request)
-    # Version headers
-    response.headers["X-BiasClear-Version"] = APP_VERSION
-    response.headers["X-Core-Version"] = CORE_VERSION
-    # Security headers
-    response.headers["Strict-Transport-Security"] = "max-age=63072000; includeSubDomains; preload"
-    response.headers["X-Content-Type-Options"] = "nosniff"
-    response.headers["X-Frame-Options"] = "DENY"
-    response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-    response.headers["Permissions-Policy"] = "camera=(), microphone=(), geolocation=()"
-    response.headers["X-Permitted-Cross-Domain-Policies"] = "none"
-    response.headers["Cross-Origin-Opener-Policy"] = "same-origin"
-    response.headers["Cross-Origin-Resource-Policy"] = "same-origin"
-    # CSP — allows inline scripts/styles for the landing page
-    response.headers["Content-Security-Policy"] = (
-        "default-src 'self'; "
-        "script-src 'self' 'unsafe-inline'; "
-        "style-src 'self' 'unsafe-inline' https://fonts.googleapis.com; "
-        "font-src 'self' https://fonts.gstatic.com; "
-        "img-src 'self' data: https://img.shields.io; "
-        "connect-src 'self'; "
-        "frame-ancestors 'none'"
+# Every value is a constant, so encode once at import and splice the raw
+# pairs into each response-start message. A tuple, so no response can
+# mutate the shared set.
+_RESPONSE_HEADERS: tuple[tuple[bytes, bytes], ...] = tuple(
+    (name.lower().encode("latin-1"), value.encode("latin-1"))
+    for name, value in (
+        # Version headers
+        ("X-BiasClear-Version", APP_VERSION),
+        ("X-Core-Version", CORE_VERSION),
+        # Security headers
+        ("Strict-Transport-Security", "max-age=63072000; includeSubDomains; preload"),
+        ("X-Content-Type-Options", "nosniff"),
+        ("X-Frame-Options", "DENY"),
+        ("Referrer-Policy", "strict-origin-when-cross-origin"),
+        ("Permissions-Policy", "camera=(), microphone=(), geolocation=()"),
+        ("X-Permitted-Cross-Domain-Policies", "none"),
+        ("Cross-Origin-Opener-Policy", "same-origin"),
+        ("Cross-Origin-Resource-Policy", "same-origin"),
+        # CSP — allows inline scripts/styles for the landing page
+        ("Content-Security-Policy", (
+            "default-src 'self'; "
+            "script-src 'self' 'unsafe-inline'; "
+            "style-src 'self' 'unsafe-inline' https://fonts.googleapis.com; "
+            "font-src 'self' https://fonts.gstatic.com; "
+            "img-src 'self' data: https://img.shields.io; "
+            "connect-src 'self'; "
+            "frame-ancestors 'none'"
+        )),
     )
-    return response
+)
+
+
+class SecurityHeadersMiddleware:
+    """Add security and version headers to all responses."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *_RESPONSE_HEADERS]
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+app.add_middleware(SecurityHeadersMiddleware)
 
 
 # --- Body Size Limit Middleware ---
 _MAX_BODY_BYTES = 1_048_576  # 1 MB
 
 
-@app.middleware("http")
-async def enforce_body_size_limit(request: Request, call_next):
-    """Reject requests exceeding 1MB — guards both Content-Length and chunked bodies."""
-    content_length = request.headers.get("content-length")
-    if content_length:
+class _BodyTooLarge(Exception):
+    pass
+
+
+class BodySizeLimitMiddleware:
+    """Reject request bodies over max_bytes — guards both Content-Length and chunked bodies.
+
+    Pure ASGI: the body is counted as the route reads it, never buffered
+    here, so an oversized stream is cut off at the first chunk over the cap.
+    """
+
+    def __init__(self, app: ASGIApp, max_bytes: int):
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Read-only assets carry no body
+        if scope["type"] != "http" or scope["path"].startswith("/static"):
+            await self.app(scope, receive, send)
+            return
+
+        chunked = False
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                try:
+                    declared = int(value)
+                except ValueError:
+                    chunked = True  # Malformed content-length; fall through to the streamed check
+                    break
+                if declared > self.max_bytes:
+                    await self._reject(scope, receive, send)
+                    return
+                # The server rejects bodies that overrun a declared length,
+                # so a valid Content-Length under the cap needs no counting
+                await self.app(scope, receive, send)
+                return
+            if name == b"transfer-encoding" and b"chunked" in value.lower():
+                chunked = True
+
+        # HTTP/1.x framing: no Content-Length and no chunked coding means no body
+        if not chunked and scope.get("http_version", "1.1").startswith("1"):
+            await self.app(scope, receive, send)
+            return
+
+        received = 0
+        overflowed = False
+        response_started = False
+
+        async def limited_receive() -> Message:
+            nonlocal received, overflowed
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    overflowed = True
+                    raise _BodyTooLarge
+            return message
+
+        async def guarded_send(message: Message) -> None:
+            nonlocal response_started
+            if overflowed:
+                return  # Drop whatever the route made of the aborted read
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
         try:
-            if int(content_length) > _MAX_BODY_BYTES:
-                return JSONResponse(
-                    status_code=413,
-                    content={"detail": "Request body too large."},
-                )
-        except ValueError:
-            pass  # Malformed content-length; let the framework handle it
-
-    # For methods that carry a body, also check actual size
-    # (catches chunked transfer encoding with no Content-Length header)
-    if request.method in ("POST", "PUT", "PATCH"):
-        body = await request.body()
-        if len(body) > _MAX_BODY_BYTES:
-            return JSONResponse(
-                status_code=413,
-                content={"detail": "Request body too large."},
-            )
+            await self.app(scope, limited_receive, guarded_send)
+        except Exception:
+            if not overflowed:
+                raise
+        if overflowed and not response_started:
+            await self._reject(scope, receive, send)
+
+    @staticmethod
+    async def _reject(scope: Scope, receive: Receive, send: Send) -> None:
+        response = ORJSONResponse(
+            status_code=413,
+            content={"detail": "Request body too large."},
+        )
+        await response(scope, receive, send)
 
-    return await call_next(request)
+
+app.add_middleware(BodySizeLimitMiddleware, max_bytes=_MAX_BODY_BYTES)
 
 
 # --- Request Logging Middleware ---
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
+class RequestLoggingMiddleware:
     """Log every API request with method, path, status, duration."""
-    path = request.url.path
-    # Skip noise: static assets and health checks
-    if path.startswith("/static") or path == "/health":
-        return await call_next(request)
 
-    start = time.time()
-    response = await call_next(request)
-    duration_ms = round((time.time() - start) * 1000, 1)
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        path = scope["path"]
+        # Skip noise: static assets and health checks (and everything when
+        # INFO is filtered out, so no timing or record building is wasted)
+        if path.startswith("/static") or path in ("/health", "/health/live") or not logger.isEnabledFor(logging.INFO):
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        start = time.perf_counter_ns()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        await self.app(scope, receive, send_with_status)
+        duration_ms = (time.perf_counter_ns() - start) // 100_000 / 10  # 0.1ms resolution
+
+        method = scope["method"]
+        logger.info(
+            "%s %s → %s (%sms)", method, path, status_code, duration_ms,
+            extra={
+                "method": method,
+                "path": path,
+                "status_code": status_code,
+                "duration_ms": duration_ms,
+            },
+        )
 
-    logger.info(
-        f"{request.method} {path} → {response.status_code} ({duration_ms}ms)",
-        extra={
-            "method": request.method,
-            "path": path,
-            "status_code": response.status_code,
-            "duration_ms": duration_ms,
-        },
-    )
-    return response
+
+app.add_middleware(RequestLoggingMiddleware)
@@ -24,22 +24,43 @@ from biasclear.config import APP_VERSION
 
 __version__ = APP_VERSION
 
-from biasclear.frozen_core import (
-    frozen_core,
-    CoreEvaluation,
-    Flag,
-    StructuralPattern,
-    CORE_VERSION,
-    PRINCIPLES,
-    PIT_TIERS,
-)
-from biasclear.detector import scan_local, scan_deep, scan_full
-from biasclear.corrector import correct_bias
-from biasclear.scorer import calculate_truth_score
-from biasclear.audit import AuditChain, audit_chain
-from biasclear.patterns.learned import LearningRing, learning_ring
-from biasclear.llm import LLMProvider
-from biasclear.llm.factory import get_provider
+import importlib
+
+# frozen_core is bound eagerly: it is also the name of a submodule, and a
+# submodule import would otherwise shadow the lazy attribute.
+from biasclear.frozen_core import frozen_core
+
+# Everything else loads on first access (PEP 562), so `import biasclear`
+# doesn't open the audit or pattern databases or pull in the LLM SDKs.
+_LAZY = {
+    "CoreEvaluation": "biasclear.frozen_core",
+    "Flag": "biasclear.frozen_core",
+    "StructuralPattern": "biasclear.frozen_core",
+    "CORE_VERSION": "biasclear.frozen_core",
+    "PRINCIPLES": "biasclear.frozen_core",
+    "PIT_TIERS": "biasclear.frozen_core",
+    "scan_local": "biasclear.detector",
+    "scan_deep": "biasclear.detector",
+    "scan_full": "biasclear.detector",
+    "correct_bias": "biasclear.corrector",
+    "calculate_truth_score": "biasclear.scorer",
+    "AuditChain": "biasclear.audit",
+    "audit_chain": "biasclear.audit",
+    "LearningRing": "biasclear.patterns.learned",
+    "learning_ring": "biasclear.patterns.learned",
+    "LLMProvider": "biasclear.llm",
+    "get_provider": "biasclear.llm.factory",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "frozen_core",
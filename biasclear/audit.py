@@ -8,15 +8,130 @@ the previous hash, creating a tamper-evident audit trail.
 If any entry is modified after the fact, the chain breaks
 and the tampering is detectable via verify_chain().
 
+Events are chained in memory as they are logged (so the entry hash is
+known immediately) and handed to a single background writer thread
+that commits them in batches — request handlers never wait on a
+per-event fsync. The trade-off: a hard crash loses entries still in
+the queue (at most a few batches), and the loss is not detectable
+afterwards — the Merkle root is rebuilt from the stored rows at
+startup, so the surviving chain simply ends earlier and still verifies.
+
+Several processes (e.g. uvicorn workers) may share one database: each
+batch re-reads the stored head inside its write transaction and
+re-links onto it if another writer got there first, so the chain stays
+linear with no id collisions. Hashes returned by log_async() are only
+stable with a single writer, though — with several, an entry can be
+re-linked behind another process's commit and its early hash is
+superseded. Give each worker its own BIASCLEAR_AUDIT_DB, or use
+submit()/log(), where the exact stored hash matters.
+
 This is a local chain-of-custody log, not a distributed blockchain.
 """
 
 import hashlib
-import json
+import itertools
+import logging
+import queue
 import sqlite3
 import threading
+from collections import deque
+from concurrent.futures import Future
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import Any, NamedTuple, Optional, Sequence
+
+import orjson
+
+logger = logging.getLogger("biasclear.audit")
+
+# Canonical entry encoding: sorted keys, compact, non-str keys allowed.
+# Payloads are stored as the raw orjson bytes (BLOB) and hashed as-is.
+# Verification rehashes whatever was stored, so older TEXT entries
+# written with json.dumps (unsorted, spaced) still verify unchanged.
+_CANONICAL_JSON = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+_sha256 = hashlib.sha256
+
+
+# prev_hash of the first entry in the chain
+_GENESIS_PREV_HASH = "0" * 64
+
+# Merkle root of an empty chain
+_EMPTY_ROOT = "0" * 64
+
+# Upper bound on events chained and committed in one writer transaction.
+_WRITE_BATCH_MAX = 256
+
+# Default wait for the writer to drain. Reads flush first so they see
+# queued events, but never hang if the writer is stuck on a locked DB.
+_FLUSH_TIMEOUT = 5.0
+
+
+def _chain_hash(
+    entry_id: int,
+    prev_hash: str,
+    event_type: str,
+    data: bytes | str,
+    timestamp: str,
+    core_version: str,
+) -> str:
+    """SHA-256 hex of one entry — the format every stored hash commits to.
+
+    The digest covers the UTF-8 bytes of the fields in order, so BLOB
+    payloads hash without a decode and TEXT rows from before the BLOB
+    column hash identically. One join + one OpenSSL call (SHA-NI where
+    the CPU has it).
+    """
+    if isinstance(data, str):
+        data = data.encode()
+    return _sha256(b"".join((
+        f"{entry_id}{prev_hash}{event_type}".encode(),
+        data,
+        f"{timestamp}{core_version}".encode(),
+    ))).hexdigest()
+
+
+class _PendingEntry(NamedTuple):
+    row: tuple  # (id, prev_hash, hash, event_type, data, timestamp, core_version)
+    future: Future
+
+
+class IncrementalMerkleTree:
+    """Append-only Merkle accumulator over chain entry hashes.
+
+    Keeps one pending subtree root per level (the "frontier"), so an
+    append touches at most log2(n) nodes and memory stays O(log n)
+    regardless of chain length. Leaves and interior nodes are
+    domain-separated (0x00 / 0x01 prefix) so a leaf can never be
+    replayed as an interior node.
+    """
+
+    def __init__(self):
+        self.size = 0
+        self.frontier: list[Optional[bytes]] = []
+
+    def append(self, entry_hash: str) -> None:
+        node = hashlib.sha256(b"\x00" + entry_hash.encode()).digest()
+        level, n = 0, self.size
+        # Each trailing 1-bit of the current size is a completed left
+        # sibling waiting at that level — merge upward until a free slot.
+        while n & 1:
+            node = hashlib.sha256(b"\x01" + self.frontier[level] + node).digest()
+            self.frontier[level] = None
+            level, n = level + 1, n >> 1
+        if level == len(self.frontier):
+            self.frontier.append(node)
+        else:
+            self.frontier[level] = node
+        self.size += 1
+
+    def root(self) -> str:
+        """Fold the frontier (lowest level first) into a single root hex."""
+        acc: Optional[bytes] = None
+        for node in self.frontier:
+            if node is None:
+                continue
+            acc = node if acc is None else hashlib.sha256(b"\x01" + node + acc).digest()
+        return acc.hex() if acc is not None else _EMPTY_ROOT
 
 
 class AuditChain:
@@ -25,43 +140,103 @@ class AuditChain:
     def __init__(self, db_path: str = "biasclear_audit.db"):
         self.db_path = db_path
         self._lock = threading.Lock()
+        self._tls = threading.local()
+        self._conns: list[sqlite3.Connection] = []
+        self._conns_lock = threading.Lock()
         self._init_db()
+        self._merkle = self._build_merkle()
+        # Chain head, read once; afterwards advanced in memory as events
+        # are queued (under _head_lock, so queue order == chain order)
+        self._head_lock = threading.Lock()
+        self._last_hash = self._get_prev_hash(self._get_conn())
+        self._next_id = self._get_next_id(self._get_conn())
+        # (next id, last hash) as of the last successful commit — where the
+        # in-memory head is reset to when a batch fails
+        self._committed = (self._next_id, self._last_hash)
+
+        self._queue: queue.SimpleQueue[Optional[_PendingEntry]] = queue.SimpleQueue()
+        # Entries re-linked after a failed batch; drained before _queue.
+        # Only the writer thread touches it.
+        self._backlog: deque[Optional[_PendingEntry]] = deque()
+        self._pending = 0
+        self._idle = threading.Condition()
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, name="biasclear-audit-writer", daemon=True,
+        )
+        self._writer_thread.start()
 
     def _init_db(self):
-        with self._get_conn() as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS audit_chain (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    prev_hash TEXT NOT NULL,
-                    hash TEXT NOT NULL,
-                    event_type TEXT NOT NULL,
-                    data TEXT NOT NULL,
-                    timestamp TEXT NOT NULL,
-                    core_version TEXT NOT NULL
-                )
-            """)
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_event_type
-                ON audit_chain(event_type)
-            """)
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_timestamp
-                ON audit_chain(timestamp)
-            """)
-            conn.commit()
+        conn = self._get_conn()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS audit_chain (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                prev_hash TEXT NOT NULL,
+                hash TEXT NOT NULL,
+                event_type TEXT NOT NULL,
+                data BLOB NOT NULL,
+                timestamp TEXT NOT NULL,
+                core_version TEXT NOT NULL
+            )
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_event_type
+            ON audit_chain(event_type)
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_timestamp
+            ON audit_chain(timestamp)
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_hash
+            ON audit_chain(hash)
+        """)
 
     def _get_conn(self) -> sqlite3.Connection:
-        return sqlite3.connect(self.db_path)
+        """Per-thread connection, opened once in autocommit mode with WAL.
+
+        WAL lets readers proceed while the writer thread commits, and
+        synchronous=NORMAL drops the per-commit fsync (a crash can lose
+        the last transactions but never corrupts the chain).
+        """
+        conn = getattr(self._tls, "conn", None)
+        if conn is None:
+            # check_same_thread=False only so close_connections() can close
+            # it from the shutdown thread; each connection is used by its owner.
+            conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            self._tls.conn = conn
+            with self._conns_lock:
+                self._conns.append(conn)
+        return conn
+
+    def close_connections(self) -> None:
+        """Close every per-thread connection; threads reopen lazily on next use."""
+        with self._conns_lock:
+            conns, self._conns = self._conns, []
+        for conn in conns:
+            conn.close()
+        self._tls = threading.local()
+
+    def _build_merkle(self) -> IncrementalMerkleTree:
+        """Rebuild the in-memory Merkle frontier from stored entry hashes."""
+        tree = IncrementalMerkleTree()
+        conn = self._get_conn()
+        for (entry_hash,) in conn.execute("SELECT hash FROM audit_chain ORDER BY id"):
+            tree.append(entry_hash)
+        return tree
 
     def _get_prev_hash(self, conn: sqlite3.Connection) -> str:
         row = conn.execute(
             "SELECT hash FROM audit_chain ORDER BY id DESC LIMIT 1"
         ).fetchone()
-        return row[0] if row else "0" * 64
+        return row[0] if row else _GENESIS_PREV_HASH
 
-    def log(self, event_type: str, data: Any, core_version: str = "1.0.0") -> str:
+    def submit(self, event_type: str, data: Any, core_version: str = "1.0.0") -> Future:
         """
-        Log an event to the audit chain.
+        Queue an event for the audit chain without waiting for the write.
 
         Event types:
           - scan_local:     Local-only scan completed
@@ -74,59 +249,277 @@ class AuditChain:
           - pattern_deactivated: Pattern deactivated (FP threshold)
           - chain_verified:     Chain integrity check performed
 
-        Returns the SHA-256 hash of the new entry.
+        Returns a Future resolving to the SHA-256 hash of the new entry
+        once it is committed. Async callers can await it via
+        asyncio.wrap_future(); fire-and-forget callers can drop it.
         """
-        with self._lock:
-            with self._get_conn() as conn:
-                prev_hash = self._get_prev_hash(conn)
-                timestamp = datetime.now(timezone.utc).isoformat()
-                data_str = json.dumps(data, default=str)
+        return self._enqueue(event_type, data, core_version).future
+
+    def log(self, event_type: str, data: Any, core_version: str = "1.0.0") -> str:
+        """Log an event and block until committed. Returns the entry hash."""
+        return self.submit(event_type, data, core_version).result()
+
+    def log_async(self, event_type: str, data: Any, core_version: str = "1.0.0") -> str:
+        """Log an event and return its hash at once; the write is queued.
+
+        The hash is computed from the in-memory chain head, and the entry
+        is only durable after the next flush(). Reads and verify_chain()
+        flush first, so they always see it.
+
+        If a batch fails to commit, its entries are dropped and everything
+        queued behind it is re-linked onto the last committed entry, so the
+        stored chain never references a hash that was not written. Hashes
+        already handed out for those entries are then superseded (logged);
+        callers that must hold the stored hash should use submit() or log().
+        """
+        return self._enqueue(event_type, data, core_version).row[2]
+
+    def _enqueue(self, event_type: str, data: Any, core_version: str) -> _PendingEntry:
+        timestamp = datetime.now(timezone.utc).isoformat()
+        data_bytes = orjson.dumps(data, default=str, option=_CANONICAL_JSON)
+        with self._head_lock:
+            entry_id, prev_hash = self._next_id, self._last_hash
+            # Hash includes the entry ID — prevents tail truncation attacks
+            new_hash = _chain_hash(
+                entry_id, prev_hash, event_type, data_bytes, timestamp, core_version,
+            )
+            entry = _PendingEntry(
+                (entry_id, prev_hash, new_hash, event_type, data_bytes, timestamp, core_version),
+                Future(),
+            )
+            self._next_id, self._last_hash = entry_id + 1, new_hash
+            with self._idle:
+                self._pending += 1
+                self._queue.put(entry)
+        return entry
+
+    def flush(self, timeout: Optional[float] = _FLUSH_TIMEOUT) -> bool:
+        """Wait until every queued event is committed. False on timeout."""
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    def _flush_for_read(self) -> None:
+        if not self.flush():
+            logger.warning(
+                "Audit writer did not drain within %.0fs; reading without %d queued entries",
+                _FLUSH_TIMEOUT, self._pending,
+            )
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Flush pending events and stop the writer thread."""
+        self.flush(timeout)
+        self._queue.put(None)
+        self._writer_thread.join(timeout)
 
-                # Insert with placeholder hash to get the auto-increment ID
-                cursor = conn.execute(
+    def _next_item(self, block: bool) -> Optional[_PendingEntry]:
+        if self._backlog:
+            return self._backlog.popleft()
+        return self._queue.get() if block else self._queue.get_nowait()
+
+    def _writer_loop(self) -> None:
+        while True:
+            item = self._next_item(block=True)
+            if item is None:
+                return
+            batch = [item]
+            stop = False
+            while len(batch) < _WRITE_BATCH_MAX:
+                try:
+                    item = self._next_item(block=False)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            # A failed batch must not kill the thread: flush() and every
+            # read would then wait on entries nobody will ever write.
+            try:
+                self._write_batch(batch)
+            except Exception:
+                logger.exception("Audit writer failed on a batch of %d entries", len(batch))
+            finally:
+                with self._idle:
+                    self._pending -= len(batch)
+                    if self._pending == 0:
+                        self._idle.notify_all()
+            if stop:
+                return
+
+    def _write_batch(self, batch: list[_PendingEntry]) -> None:
+        """Commit a batch of pre-chained rows in one transaction, then resolve futures."""
+        rows = [entry.row for entry in batch]
+        # Commit and Merkle append happen together under the append lock,
+        # so verify_chain() never sees one without the other.
+        with self._lock:
+            conn = None
+            try:
+                conn = self._get_conn()
+                conn.execute("BEGIN IMMEDIATE")
+                head = self._sync_stored_head(conn)
+                if batch[0].row[:2] != head:
+                    batch = self._rechain(head, batch)
+                    rows = [entry.row for entry in batch]
+                conn.executemany(
                     """INSERT INTO audit_chain
-                       (prev_hash, hash, event_type, data, timestamp, core_version)
-                       VALUES (?, ?, ?, ?, ?, ?)""",
-                    (prev_hash, "pending", event_type, data_str, timestamp, core_version),
+                       (id, prev_hash, hash, event_type, data, timestamp, core_version)
+                       VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                    rows,
                 )
-                entry_id = cursor.lastrowid
+                conn.execute("COMMIT")
+            except Exception as e:
+                if conn is not None and conn.in_transaction:
+                    try:
+                        conn.execute("ROLLBACK")
+                    except sqlite3.Error:
+                        logger.exception("Audit batch rollback failed")
+                logger.error("Audit batch of %d entries failed to commit: %s", len(rows), e)
+                for entry in batch:
+                    if not entry.future.cancelled():
+                        entry.future.set_exception(e)
+                self._rechain(self._committed)
+                return
+            self._committed = (rows[-1][0] + 1, rows[-1][2])
+            for row in rows:
+                self._merkle.append(row[2])
+        for entry in batch:
+            if not entry.future.cancelled():
+                entry.future.set_result(entry.row[2])
 
-                # Compute hash WITH the entry ID — prevents tail truncation attacks
-                chain_input = f"{entry_id}{prev_hash}{event_type}{data_str}{timestamp}{core_version}"
-                new_hash = hashlib.sha256(chain_input.encode()).hexdigest()
+    def _sync_stored_head(self, conn: sqlite3.Connection) -> tuple[int, str]:
+        """Return the stored (next id, last hash), catching up on foreign rows.
 
-                conn.execute(
-                    "UPDATE audit_chain SET hash = ? WHERE id = ?",
-                    (new_hash, entry_id),
+        Call inside a transaction. Rows another process committed since
+        our last write are folded into the Merkle frontier so the cached
+        root keeps matching the table.
+        """
+        head = (self._get_next_id(conn), self._get_prev_hash(conn))
+        if head != self._committed:
+            foreign = conn.execute(
+                "SELECT hash FROM audit_chain WHERE id >= ? ORDER BY id",
+                (self._committed[0],),
+            ).fetchall()
+            if foreign:
+                logger.warning(
+                    "Audit chain has %d entries from another writer; hashes returned "
+                    "by log_async may be superseded", len(foreign),
                 )
-                conn.commit()
-                return new_hash
-
-    def get_recent(self, limit: int = 20, event_type: Optional[str] = None) -> list[dict]:
-        """Get recent audit entries, optionally filtered by event type."""
-        with self._get_conn() as conn:
-            if event_type:
-                rows = conn.execute(
-                    """SELECT id, prev_hash, hash, event_type, data, timestamp, core_version
-                       FROM audit_chain WHERE event_type = ?
-                       ORDER BY id DESC LIMIT ?""",
-                    (event_type, limit),
-                ).fetchall()
-            else:
-                rows = conn.execute(
-                    """SELECT id, prev_hash, hash, event_type, data, timestamp, core_version
-                       FROM audit_chain ORDER BY id DESC LIMIT ?""",
-                    (limit,),
-                ).fetchall()
-
-        return [
-            {
-                "id": r[0], "prev_hash": r[1], "hash": r[2],
-                "event_type": r[3], "data": json.loads(r[4]),
-                "timestamp": r[5], "core_version": r[6],
-            }
-            for r in rows
-        ]
+            for (entry_hash,) in foreign:
+                self._merkle.append(entry_hash)
+            self._committed = head
+        return head
+
+    def _rechain(
+        self, head: tuple[int, str], batch: Sequence[_PendingEntry] = (),
+    ) -> list[_PendingEntry]:
+        """Re-link `batch` and every queued entry onto `head` (next id, prev hash).
+
+        Used when the entries were chained onto hashes that never reached
+        the DB (a failed batch) or that another writer has since built on.
+        They are re-hashed in order and the in-memory head moves to the new
+        tail; holding _head_lock keeps new events from linking to the stale
+        head meanwhile. Returns the re-linked batch.
+        """
+        with self._head_lock:
+            pending = [*batch, *self._backlog]
+            while True:
+                try:
+                    pending.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            next_id, prev_hash = head
+            self._backlog.clear()
+            relinked: list[_PendingEntry] = []
+            reissued = 0
+            for entry in pending:
+                if entry is not None:
+                    _, _, old_hash, event_type, data, timestamp, core_version = entry.row
+                    new_hash = _chain_hash(
+                        next_id, prev_hash, event_type, data, timestamp, core_version,
+                    )
+                    reissued += new_hash != old_hash
+                    entry = _PendingEntry(
+                        (next_id, prev_hash, new_hash, event_type, data, timestamp, core_version),
+                        entry.future,
+                    )
+                    next_id, prev_hash = next_id + 1, new_hash
+                relinked.append(entry)
+            self._backlog.extend(relinked[len(batch):])
+            self._next_id, self._last_hash = next_id, prev_hash
+        if reissued:
+            logger.warning(
+                "Re-linked %d queued audit entries onto entry %d; their earlier hashes are superseded",
+                reissued, head[0] - 1,
+            )
+        return relinked[:len(batch)]
+
+    @staticmethod
+    def _get_next_id(conn: sqlite3.Connection) -> int:
+        # Mirror AUTOINCREMENT: never reuse an ID, even after tail deletion
+        row = conn.execute(
+            """SELECT MAX(
+                   COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'audit_chain'), 0),
+                   COALESCE((SELECT MAX(id) FROM audit_chain), 0)
+               )"""
+        ).fetchone()
+        return row[0] + 1
+
+    def get_recent(
+        self,
+        limit: int = 20,
+        event_type: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> list:
+        """Get recent audit entries, optionally filtered by event type.
+
+        With `fields`, each row is a tuple of those top-level data keys
+        (None where absent), extracted in SQL by json_extract — the
+        payload is never decoded in Python.
+        """
+        self._flush_for_read()
+        conn = self._get_conn()
+        if fields:
+            columns = ", ".join("json_extract(CAST(data AS TEXT), ?)" for _ in fields)
+            params: list = [f"$.{name}" for name in fields]
+        else:
+            columns = "id, prev_hash, hash, event_type, data, timestamp, core_version"
+            params = []
+        if event_type:
+            rows = conn.execute(
+                f"""SELECT {columns}
+                   FROM audit_chain WHERE event_type = ?
+                   ORDER BY id DESC LIMIT ?""",
+                (*params, event_type, limit),
+            ).fetchall()
+        else:
+            rows = conn.execute(
+                f"""SELECT {columns}
+                   FROM audit_chain ORDER BY id DESC LIMIT ?""",
+                (*params, limit),
+            ).fetchall()
+
+        if fields:
+            return rows
+        return [self._row_to_entry(r) for r in rows]
+
+    def get_by_hash(self, entry_hash: str) -> Optional[dict]:
+        """Look up a single entry by its chain hash (indexed, any chain depth)."""
+        self._flush_for_read()
+        conn = self._get_conn()
+        row = conn.execute(
+            """SELECT id, prev_hash, hash, event_type, data, timestamp, core_version
+               FROM audit_chain WHERE hash = ? LIMIT 1""",
+            (entry_hash,),
+        ).fetchone()
+        return self._row_to_entry(row) if row else None
+
+    @staticmethod
+    def _row_to_entry(r: tuple) -> dict:
+        return {
+            "id": r[0], "prev_hash": r[1], "hash": r[2],
+            "event_type": r[3], "data": orjson.loads(r[4]),
+            "timestamp": r[5], "core_version": r[6],
+        }
 
     def verify_chain(self, limit: int = 100) -> dict:
         """Verify integrity of the most recent entries.
@@ -134,46 +527,84 @@ class AuditChain:
         Checks newest entries first (most security-relevant). The subquery
         fetches the N most recent rows, then we re-sort ASC for chain-link
         validation (each entry's prev_hash must match the prior entry's hash).
+
+        When the window reaches back to genesis, the stored hashes are also
+        folded into a Merkle root and compared to the incrementally
+        maintained one — this catches wholesale re-chaining and tail
+        truncation, which per-row rehashing alone cannot see. Otherwise
+        that comparison is skipped, and `merkle_checked` is False: a
+        `verified` result then only covers the links inside the window.
         """
-        with self._get_conn() as conn:
-            rows = conn.execute(
+        # Pin a WAL read snapshot under the append lock so the cached root
+        # matches the rows, then stream them without blocking the writer.
+        self._flush_for_read()
+        conn = self._get_conn()
+        with self._lock:
+            conn.execute("BEGIN")
+            self._sync_stored_head(conn)
+            cursor = conn.execute(
                 """SELECT id, prev_hash, hash, event_type, data, timestamp, core_version
                    FROM (
                        SELECT * FROM audit_chain ORDER BY id DESC LIMIT ?
                    ) ORDER BY id ASC""",
                 (limit,),
-            ).fetchall()
-
-        if not rows:
-            return {"verified": True, "entries_checked": 0, "broken_links": []}
+            )
+            first = cursor.fetchone()
+            merkle_size, merkle_root = self._merkle.size, self._merkle.root()
 
         broken = []
-        for i, row in enumerate(rows):
-            entry_id, prev_hash, stored_hash, event_type, data_str, timestamp, core_version = row
-
-            chain_input = f"{entry_id}{prev_hash}{event_type}{data_str}{timestamp}{core_version}"
-            computed_hash = hashlib.sha256(chain_input.encode()).hexdigest()
-
-            if computed_hash != stored_hash:
-                broken.append({
-                    "id": entry_id,
-                    "issue": "hash_mismatch",
-                    "expected": computed_hash,
-                    "stored": stored_hash,
-                })
-
-            if i > 0 and prev_hash != rows[i - 1][2]:
-                broken.append({
-                    "id": entry_id,
-                    "issue": "chain_break",
-                    "expected_prev": rows[i - 1][2],
-                    "stored_prev": prev_hash,
-                })
+        checked = 0
+        window = (
+            IncrementalMerkleTree()
+            if first is None or first[1] == _GENESIS_PREV_HASH else None
+        )
+        prev_stored = None
+        try:
+            for row in itertools.chain((first,) if first else (), cursor):
+                entry_id, prev_hash, stored_hash, event_type, data, timestamp, core_version = row
+                checked += 1
+                if window is not None:
+                    window.append(stored_hash)
+
+                computed_hash = _chain_hash(
+                    entry_id, prev_hash, event_type, data, timestamp, core_version,
+                )
+
+                if computed_hash != stored_hash:
+                    broken.append({
+                        "id": entry_id,
+                        "issue": "hash_mismatch",
+                        "expected": computed_hash,
+                        "stored": stored_hash,
+                    })
+
+                if prev_stored is not None and prev_hash != prev_stored:
+                    broken.append({
+                        "id": entry_id,
+                        "issue": "chain_break",
+                        "expected_prev": prev_stored,
+                        "stored_prev": prev_hash,
+                    })
+                prev_stored = stored_hash
+        finally:
+            conn.execute("COMMIT")
+
+        if window is not None and (window.size, window.root()) != (merkle_size, merkle_root):
+            broken.insert(0, {
+                "issue": "merkle_mismatch",
+                "expected_root": merkle_root,
+                "stored_root": window.root(),
+                "expected_size": merkle_size,
+                "stored_size": window.size,
+            })
 
         return {
             "verified": len(broken) == 0,
-            "entries_checked": len(rows),
+            "entries_checked": checked,
             "broken_links": broken,
+            "merkle_checked": window is not None,
+            "merkle_root": merkle_root,
+            "merkle_size": merkle_size,
         }
 
     def get_count(
@@ -181,20 +612,24 @@ class AuditChain:
         event_type: Optional[str] = None,
         event_prefix: Optional[str] = None,
     ) -> int:
-        with self._get_conn() as conn:
-            if event_type:
-                row = conn.execute(
-                    "SELECT COUNT(*) FROM audit_chain WHERE event_type = ?",
-                    (event_type,),
-                ).fetchone()
-            elif event_prefix:
-                row = conn.execute(
-                    "SELECT COUNT(*) FROM audit_chain WHERE event_type LIKE ?",
-                    (f"{event_prefix}%",),
-                ).fetchone()
-            else:
-                row = conn.execute("SELECT COUNT(*) FROM audit_chain").fetchone()
-            return row[0] if row else 0
+        self._flush_for_read()
+        conn = self._get_conn()
+        if event_type:
+            row = conn.execute(
+                "SELECT COUNT(*) FROM audit_chain WHERE event_type = ?",
+                (event_type,),
+            ).fetchone()
+        elif event_prefix:
+            # Half-open range instead of LIKE so SQLite can seek the
+            # event_type index (and "_" isn't treated as a wildcard)
+            upper = event_prefix[:-1] + chr(ord(event_prefix[-1]) + 1)
+            row = conn.execute(
+                "SELECT COUNT(*) FROM audit_chain WHERE event_type >= ? AND event_type < ?",
+                (event_prefix, upper),
+            ).fetchone()
+        else:
+            row = conn.execute("SELECT COUNT(*) FROM audit_chain").fetchone()
+        return row[0] if row else 0
 
 
 def _get_audit_chain() -> AuditChain:
@@ -203,4 +638,16 @@ def _get_audit_chain() -> AuditChain:
     return AuditChain(db_path=settings.AUDIT_DB_PATH)
 
 
-audit_chain = _get_audit_chain()
+_singleton_lock = threading.Lock()
+
+
+def __getattr__(name: str):
+    # audit_chain is built on first access, so importing this module
+    # doesn't open SQLite or start the writer thread
+    if name != "audit_chain":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    with _singleton_lock:
+        chain = globals().get("audit_chain")
+        if chain is None:
+            chain = globals()["audit_chain"] = _get_audit_chain()
+    return chain
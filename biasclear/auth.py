@@ -54,12 +54,15 @@ if not AUTH_ENABLED:
     )
 
 
+def _key_hash(api_key: str) -> str:
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
 def _verify_key(api_key: str) -> bool:
     """Verify an API key against stored hashes."""
     if not api_key:
         return False
-    key_hash = hashlib.sha256(api_key.encode()).hexdigest()
-    return key_hash in _VALID_KEY_HASHES
+    return _key_hash(api_key) in _VALID_KEY_HASHES
 
 
 async def require_api_key(
@@ -81,14 +84,16 @@ async def require_api_key(
     if not api_key:
         return None  # Let route decide (playground token, etc.)
 
-    if not _verify_key(api_key):
+    # Hash once: the same digest validates the key and identifies it
+    key_hash = _key_hash(api_key)
+    if key_hash not in _VALID_KEY_HASHES:
         raise HTTPException(
             status_code=403,
             detail="Invalid API key.",
         )
 
     # Return hash for audit logging (never log the actual key)
-    return hashlib.sha256(api_key.encode()).hexdigest()[:12]
+    return key_hash[:12]
 
 
 def generate_api_key() -> str:
@@ -2,10 +2,18 @@
 Scan Result Cache
 
 In-memory TTL cache for scan results.
-Key = SHA-256(text + domain + mode). TTL = 1 hour.
+Key = xxh3-128(text) + length + domain + mode. TTL = 1 hour.
+
+LRU eviction with frequency-based admission (TinyLFU-style): once full,
+a new entry only displaces the least recently used one if its key has
+been looked up more often recently. Texts pasted once can't flush the
+working set of repeated scans.
 
 Prevents duplicate LLM API calls for identical inputs.
-Thread-safe via asyncio lock.
+Lock-free: used only from the event loop, and no method awaits between
+reading and updating the store. Values are opaque to the cache — the API
+stores already-validated, serialized response bodies so a hit skips
+both the scan and response-model validation.
 
 Usage:
     from biasclear.cache import scan_cache
@@ -18,71 +26,97 @@ Usage:
 
 from __future__ import annotations
 
-import asyncio
-import hashlib
 import time
-from typing import Optional
+from collections import Counter, OrderedDict
+from typing import Any, Optional
+
+import xxhash
+
+# (text length, xxh3-128 digest of text, domain, mode, extra)
+_Key = tuple[int, bytes, str, str, str]
 
 
 class ScanCache:
-    """Thread-safe in-memory cache with TTL eviction."""
+    """In-memory LRU cache with TTL expiry, used only from the event loop."""
 
     def __init__(self, ttl_seconds: int = 3600, max_entries: int = 500):
-        self._cache: dict[str, tuple[float, dict]] = {}
+        # Least recently used first; hits move an entry to the end
+        self._cache: OrderedDict[_Key, tuple[float, Any]] = OrderedDict()
         self._ttl = ttl_seconds
         self._max_entries = max_entries
-        self._lock = asyncio.Lock()
         self._hits = 0
         self._misses = 0
+        # Recent lookup counts per key, halved every _sample_size lookups
+        # so old popularity fades and the counter stays bounded
+        self._freq: Counter[_Key] = Counter()
+        self._sample_size = 10 * max_entries
+        self._lookups = 0
+
+    def _record_lookup(self, key: _Key) -> None:
+        self._freq[key] += 1
+        self._lookups += 1
+        if self._lookups >= self._sample_size:
+            self._lookups = 0
+            self._freq = Counter({k: n // 2 for k, n in self._freq.items() if n > 1})
 
     @staticmethod
-    def _make_key(text: str, domain: str, mode: str, extra: str = "") -> str:
-        """SHA-256 hash of text+domain+mode+extra (e.g., learning ring version)."""
-        raw = f"{text}||{domain}||{mode}||{extra}"
-        return hashlib.sha256(raw.encode()).hexdigest()
+    def _make_key(text: str, domain: str, mode: str, extra: str = "") -> _Key:
+        """Fingerprint of text plus domain/mode/extra (e.g., learning ring version).
+
+        Only the text is hashed — with xxh3-128, an order of magnitude
+        cheaper than SHA-256 on max-size bodies. This is a cache key, not
+        an integrity check; namespacing by length makes collisions moot.
+        A tuple of the raw digest and the short fields skips hex encoding
+        and string formatting on every lookup.
+        """
+        return len(text), xxhash.xxh3_128_digest(text.encode()), domain, mode, extra
 
     async def get(
         self, text: str, domain: str, mode: str, extra: str = "",
-    ) -> Optional[dict]:
+    ) -> Optional[Any]:
         """Return cached result if exists and not expired."""
         key = self._make_key(text, domain, mode, extra)
-        async with self._lock:
-            entry = self._cache.get(key)
-            if entry is None:
-                self._misses += 1
-                return None
-
-            ts, result = entry
-            if time.monotonic() - ts > self._ttl:
-                del self._cache[key]
-                self._misses += 1
-                return None
-
-            self._hits += 1
-            return {**result, "_cached": True}
+        self._record_lookup(key)
+        entry = self._cache.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        ts, result = entry
+        if time.monotonic() - ts > self._ttl:
+            del self._cache[key]
+            self._misses += 1
+            return None
+
+        self._cache.move_to_end(key)
+        self._hits += 1
+        return result
 
     async def put(
-        self, text: str, domain: str, mode: str, result: dict, extra: str = "",
+        self, text: str, domain: str, mode: str, result: Any, extra: str = "",
     ) -> None:
-        """Store result in cache. Evicts oldest if over max."""
-        key = self._make_key(text, domain, mode, extra)
-        async with self._lock:
-            # Evict oldest entries if at capacity
-            if len(self._cache) >= self._max_entries:
-                oldest_key = min(
-                    self._cache, key=lambda k: self._cache[k][0],
-                )
-                del self._cache[oldest_key]
+        """Store result in cache, evicting the least recently used if full.
 
-            self._cache[key] = (time.monotonic(), result)
+        When full, a new key is only admitted if it has been looked up
+        more often than the entry it would evict — unless that entry has
+        already expired, in which case it goes regardless.
+        """
+        key = self._make_key(text, domain, mode, extra)
+        if key not in self._cache and len(self._cache) >= self._max_entries:
+            victim, (ts, _) = next(iter(self._cache.items()))
+            expired = time.monotonic() - ts > self._ttl
+            if not expired and self._freq[key] <= self._freq[victim]:
+                return
+            del self._cache[victim]
+        self._cache[key] = (time.monotonic(), result)
+        self._cache.move_to_end(key)
 
     async def invalidate(
         self, text: str, domain: str, mode: str, extra: str = "",
     ) -> None:
         """Remove a specific entry."""
         key = self._make_key(text, domain, mode, extra)
-        async with self._lock:
-            self._cache.pop(key, None)
+        self._cache.pop(key, None)
 
     @property
     def stats(self) -> dict:
@@ -98,3 +132,8 @@ class ScanCache:
 
 # Singleton — shared across the application
 scan_cache = ScanCache()
+
+# Raw deep-analysis LLM answers keyed by the exact prompt. Unlike
+# scan_cache entries these survive learning ring changes, since the deep
+# prompt only varies with the text, domain and frozen-core flags.
+deep_result_cache = ScanCache(max_entries=1000)
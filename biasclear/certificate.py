@@ -21,94 +21,23 @@ import hashlib
 from html import escape
 
 
-def generate_certificate_html(
-    text: str,
-    scan_result: dict,
-    audit_hash: str,
-    certificate_id: str,
-    issued_at: str,
-    verify_url: str,
-) -> str:
-    """Generate a self-contained HTML certificate for a bias scan."""
-
-    truth_score = scan_result.get("truth_score", 0)
-    flags = scan_result.get("flags", [])
-    flag_count = len(flags)
-    domain = escape(str(scan_result.get("domain", "general")))
-    pit_tier = escape(str(scan_result.get("pit_tier", "none")))
-    bias_detected = scan_result.get("bias_detected", flag_count > 0)
-
-    # Determine status
-    if not bias_detected:
-        status = "CLEAN"
-        status_color = "#10b981"
-        status_icon = "&#10003;"
-        status_text = "No structural bias detected"
-    elif truth_score >= 70:
-        status = "LOW RISK"
-        status_color = "#f59e0b"
-        status_icon = "&#9888;"
-        status_text = f"{flag_count} minor pattern{'s' if flag_count != 1 else ''} detected"
-    else:
-        status = "BIAS DETECTED"
-        status_color = "#ef4444"
-        status_icon = "&#10007;"
-        status_text = f"{flag_count} structural distortion{'s' if flag_count != 1 else ''} detected"
-
-    # Build flags HTML
-    flags_html = ""
-    if flags:
-        for f in flags[:10]:  # Cap display at 10
-            flag_name = escape(str(
-                f.get("pattern_id", f.get("name", f.get("pattern", "Unknown")))
-            ))
-            flag_match = escape(str(f.get("matched_text", f.get("description", ""))))
-            severity = f.get("severity", "moderate")
-            pit = escape(str(f.get("pit_tier", "")))
-            sev_color = {
-                "low": "#94a3b8",
-                "moderate": "#f59e0b",
-                "high": "#ef4444",
-                "critical": "#dc2626",
-            }.get(severity, "#94a3b8")
-            pit_html = (
-                f'<span style="font-size:10px;color:#8b5cf6;margin-left:8px;">{pit}</span>'
-                if pit else ""
-            )
-            match_html = (
-                f'<div style="font-size:12px;color:#94a3b8;margin-top:2px;">'
-                f'&ldquo;{flag_match}&rdquo;</div>'
-                if flag_match else ""
-            )
-            flags_html += f"""
-            <div style="border-left:3px solid {sev_color};padding:8px 12px;margin:6px 0;
-                        background:rgba(255,255,255,0.03);border-radius:0 4px 4px 0;">
-                <div style="font-weight:600;font-size:13px;color:#e2e8f0;">
-                    {flag_name}{pit_html}
-                </div>
-                {match_html}
-                <div style="font-size:11px;color:{sev_color};margin-top:4px;
-                            text-transform:uppercase;">{escape(severity)}</div>
-            </div>"""
-    else:
-        flags_html = (
-            '<div style="color:#10b981;padding:12px;text-align:center;">'
-            '&#10003; No distortions detected</div>'
-        )
-
-    # Truncate text for display and escape HTML
-    display_text = escape(text[:500] + ("..." if len(text) > 500 else ""))
-
-    # Score gauge percentage
-    score_pct = max(0, min(100, truth_score))
+# Badge colour and icon per certificate status
+_STATUS_STYLE = {
+    "CLEAN": ("#10b981", "&#10003;"),
+    "LOW RISK": ("#f59e0b", "&#9888;"),
+    "BIAS DETECTED": ("#ef4444", "&#10007;"),
+}
 
-    # Sanitize inputs for the template
-    safe_cert_id = escape(certificate_id[:16])
-    safe_issued = escape(issued_at[:19].replace("T", " "))
-    safe_audit_hash = escape(audit_hash)
-    safe_verify_url = escape(verify_url)
+_SEVERITY_COLORS = {
+    "low": "#94a3b8",
+    "moderate": "#f59e0b",
+    "high": "#ef4444",
+    "critical": "#dc2626",
+}
 
-    return f"""<!DOCTYPE html>
+# Everything up to the certificate body (stylesheet and header badge)
+# depends only on the status, so it is rendered once per status here.
+_CERT_HEAD_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="UTF-8">
@@ -184,7 +113,97 @@ def generate_certificate_html(
       <span>{status}</span>
     </div>
   </div>
-  <div class="body">
+"""
+
+_CERT_HEADS = {
+    status: _CERT_HEAD_TEMPLATE.format(
+        status=status, status_color=color, status_icon=icon,
+    )
+    for status, (color, icon) in _STATUS_STYLE.items()
+}
+
+
+def generate_certificate_html(
+    text: str,
+    scan_result: dict,
+    audit_hash: str,
+    certificate_id: str,
+    issued_at: str,
+    verify_url: str,
+) -> str:
+    """Generate a self-contained HTML certificate for a bias scan."""
+
+    truth_score = scan_result.get("truth_score", 0)
+    flags = scan_result.get("flags", [])
+    flag_count = len(flags)
+    domain = escape(str(scan_result.get("domain", "general")))
+    pit_tier = escape(str(scan_result.get("pit_tier", "none")))
+    bias_detected = scan_result.get("bias_detected", flag_count > 0)
+
+    # Determine status
+    if not bias_detected:
+        status = "CLEAN"
+        status_text = "No structural bias detected"
+    elif truth_score >= 70:
+        status = "LOW RISK"
+        status_text = f"{flag_count} minor pattern{'s' if flag_count != 1 else ''} detected"
+    else:
+        status = "BIAS DETECTED"
+        status_text = f"{flag_count} structural distortion{'s' if flag_count != 1 else ''} detected"
+    status_color = _STATUS_STYLE[status][0]
+
+    # Build flags HTML
+    if flags:
+        parts = []
+        for f in flags[:10]:  # Cap display at 10
+            flag_name = escape(str(
+                f.get("pattern_id", f.get("name", f.get("pattern", "Unknown")))
+            ))
+            flag_match = escape(str(f.get("matched_text", f.get("description", ""))))
+            severity = f.get("severity", "moderate")
+            pit = escape(str(f.get("pit_tier", "")))
+            sev_color = _SEVERITY_COLORS.get(severity, "#94a3b8")
+            pit_html = (
+                f'<span style="font-size:10px;color:#8b5cf6;margin-left:8px;">{pit}</span>'
+                if pit else ""
+            )
+            match_html = (
+                f'<div style="font-size:12px;color:#94a3b8;margin-top:2px;">'
+                f'&ldquo;{flag_match}&rdquo;</div>'
+                if flag_match else ""
+            )
+            parts.append(f"""
+            <div style="border-left:3px solid {sev_color};padding:8px 12px;margin:6px 0;
+                        background:rgba(255,255,255,0.03);border-radius:0 4px 4px 0;">
+                <div style="font-weight:600;font-size:13px;color:#e2e8f0;">
+                    {flag_name}{pit_html}
+                </div>
+                {match_html}
+                <div style="font-size:11px;color:{sev_color};margin-top:4px;
+                            text-transform:uppercase;">{escape(severity)}</div>
+            </div>""")
+        flags_html = "".join(parts)
+    else:
+        flags_html = (
+            '<div style="color:#10b981;padding:12px;text-align:center;">'
+            '&#10003; No distortions detected</div>'
+        )
+
+    # Truncate text for display and escape HTML
+    display_text = escape(text[:500] + ("..." if len(text) > 500 else ""))
+
+    # Score gauge percentage
+    score_pct = max(0, min(100, truth_score))
+
+    # Sanitize inputs for the template
+    safe_cert_id = escape(certificate_id[:16])
+    safe_issued = escape(issued_at[:19].replace("T", " "))
+    safe_audit_hash = escape(audit_hash)
+    safe_verify_url = escape(verify_url)
+
+    return "".join((
+        _CERT_HEADS[status],
+        f"""  <div class="body">
     <div class="section">
       <div class="section-title">Truth Alignment Score</div>
       <div class="score-container">
@@ -244,10 +263,16 @@ def generate_certificate_html(
   </div>
 </div>
 </body>
-</html>"""
+</html>""",
+    ))
 
 
 def compute_certificate_id(text: str, timestamp: str) -> str:
-    """Deterministic certificate ID from text content + timestamp."""
-    content = f"{text}{timestamp}"
-    return hashlib.sha256(content.encode()).hexdigest()
+    """Deterministic certificate ID from text content + timestamp.
+
+    Same digest as hashing the concatenation, without building a
+    joined copy of the text first.
+    """
+    h = hashlib.sha256(text.encode())
+    h.update(timestamp.encode())
+    return h.hexdigest()
@@ -41,6 +41,13 @@ class Settings:
         "BEDROCK_MODEL_ID", "us.anthropic.claude-sonnet-4-6"
     )
 
+    # Max concurrent blocking LLM calls (dedicated thread pool size)
+    LLM_MAX_INFLIGHT: int = int(os.getenv("BIASCLEAR_LLM_MAX_INFLIGHT", "8"))
+    # Max concurrent LLM-backed items within a single /scan/batch request
+    BATCH_MAX_CONCURRENCY: int = int(os.getenv("BIASCLEAR_BATCH_MAX_CONCURRENCY", "8"))
+    # Upstream LLM requests per minute across the process (0 = unpaced)
+    LLM_MAX_RPM: int = int(os.getenv("BIASCLEAR_LLM_MAX_RPM", "0"))
+
     # --- Audit ---
     AUDIT_DB_PATH: str = os.getenv("BIASCLEAR_AUDIT_DB", _DEFAULT_AUDIT_PATH)
 
@@ -56,6 +63,12 @@ class Settings:
     HOST: str = os.getenv("BIASCLEAR_HOST", "0.0.0.0")
     PORT: int = int(os.getenv("BIASCLEAR_PORT", "8000"))
 
+    # --- Rate limiting ---
+    # Shared Redis limiter for multi-worker deployments (empty = in-process).
+    # Only covers rate limits: workers sharing AUDIT_DB_PATH keep one valid
+    # chain, but /scan audit hashes are only stable with a single writer.
+    REDIS_URL: str = os.getenv("BIASCLEAR_REDIS_URL", "")
+
     # --- CORS ---
     CORS_ORIGINS: str = os.getenv("BIASCLEAR_CORS_ORIGINS", "https://biasclear.com")
 
@@ -14,6 +14,7 @@ Key design principles:
 
 from __future__ import annotations
 
+import itertools
 import logging
 from typing import Optional
 
@@ -38,11 +39,11 @@ _dmp = dmp_module.diff_match_patch()
 # Build a lookup table: pattern_id -> StructuralPattern
 _PATTERN_LOOKUP: dict[str, StructuralPattern] = {
     p.id: p
-    for p in (
-        STRUCTURAL_PATTERNS
-        + LEGAL_STRUCTURAL_PATTERNS
-        + MEDIA_STRUCTURAL_PATTERNS
-        + FINANCIAL_STRUCTURAL_PATTERNS
+    for p in itertools.chain(
+        STRUCTURAL_PATTERNS,
+        LEGAL_STRUCTURAL_PATTERNS,
+        MEDIA_STRUCTURAL_PATTERNS,
+        FINANCIAL_STRUCTURAL_PATTERNS,
     )
 }
 
@@ -101,6 +102,17 @@ Return JSON with:
 - "bias_removed": array of pattern IDs corrected in THIS iteration
 - "confidence": float 0.0 to 1.0"""
 
+# Split once at the placeholders so each prompt is a single join. The
+# frozen principles never change, so they are baked into the head.
+_CORRECTION_HEAD, _rest = CORRECTION_PROMPT.replace(
+    "{principles}", frozen_core.get_principles_prompt()
+).split("{flag_instructions}")
+_CORRECTION_MID, _CORRECTION_TAIL = _rest.split("{text}")
+_REFINEMENT_HEAD, _rest = REFINEMENT_PROMPT.split("{iteration}")
+_REFINEMENT_MID, _rest = _rest.split("{surviving_flags}")
+_REFINEMENT_TEXT, _REFINEMENT_TAIL = _rest.split("{text}")
+del _rest
+
 
 MAX_ITERATIONS = 3
 
@@ -136,48 +148,36 @@ def _build_flag_instructions(scan_result: dict) -> str:
     Each structural flag is looked up in the pattern registry.
     Uses the pattern's description as correction guidance.
     """
-    lines = []
-    idx = 1
-    flags = scan_result.get("flags", [])
-
-    for flag in flags:
-        if flag.get("category") != "structural":
-            continue
-
-        pattern_id = flag.get("pattern_id", "")
-        matched_text = flag.get("matched_text", "")
-        severity = flag.get("severity", "moderate")
-        pattern = _PATTERN_LOOKUP.get(pattern_id)
-
-        description = ""
-        if pattern:
-            description = pattern.description
-        elif flag.get("description"):
-            description = flag["description"]
-
-        lines.append(
-            f'{idx}. [{pattern_id}] (severity: {severity})\n'
-            f'   Matched: "{matched_text}"\n'
-            f'   What to fix: {description}\n'
-            f'   Action: Remove or rephrase the distortion framing. Keep factual content.'
-        )
-        idx += 1
+    # (label, matched text, guidance), structural flags listed before AI ones
+    structural: list[tuple[str, str, str]] = []
+    ai: list[tuple[str, str, str]] = []
+
+    for flag in scan_result.get("flags", []):
+        get = flag.get
+        pattern_id = get("pattern_id", "")
+        matched_text = get("matched_text", "")
+        severity = get("severity", "moderate")
+
+        if get("category") == "structural":
+            pattern = _PATTERN_LOOKUP.get(pattern_id)
+            description = pattern.description if pattern else (get("description") or "")
+            structural.append(
+                (f"[{pattern_id}] (severity: {severity})", matched_text, description)
+            )
 
-    # Include AI-sourced flags too
-    for flag in flags:
-        if flag.get("source") == "ai":
-            pattern_id = flag.get("pattern_id", "")
-            matched_text = flag.get("matched_text", "")
-            severity = flag.get("severity", "moderate")
-            description = flag.get("description", "AI-detected distortion pattern")
-
-            lines.append(
-                f'{idx}. [{pattern_id}] (severity: {severity}, source: AI)\n'
-                f'   Matched: "{matched_text}"\n'
-                f'   What to fix: {description}\n'
-                f'   Action: Remove or rephrase the distortion framing. Keep factual content.'
+        if get("source") == "ai":
+            description = get("description", "AI-detected distortion pattern")
+            ai.append(
+                (f"[{pattern_id}] (severity: {severity}, source: AI)", matched_text, description)
             )
-            idx += 1
+
+    lines = [
+        f'{idx}. {label}\n'
+        f'   Matched: "{matched_text}"\n'
+        f'   What to fix: {description}\n'
+        f'   Action: Remove or rephrase the distortion framing. Keep factual content.'
+        for idx, (label, matched_text, description) in enumerate(structural + ai, 1)
+    ]
 
     if not lines:
         return "No specific structural distortions flagged for correction."
@@ -239,42 +239,68 @@ def _compute_diff_spans(original: str, corrected: str) -> list[dict]:
 
     Uses diff-match-patch (Google's text diff library) — no LLM involved.
     Returns spans with type (equal/delete/insert), text, and positions.
-    """
-    diffs = _dmp.diff_main(original, corrected)
-    _dmp.diff_cleanupSemantic(diffs)
 
-    spans = []
+    Unchanged text and pure appends/prepends/truncations are common
+    (e.g. the LLM declined to edit) and are resolved without the diff.
+    """
+    diffs: list[tuple[int, str]]
+    if original == corrected:
+        diffs = [(0, original)] if original else []
+    elif not original:
+        diffs = [(1, corrected)]
+    elif not corrected:
+        diffs = [(-1, original)]
+    elif corrected.startswith(original):
+        diffs = [(0, original), (1, corrected[len(original):])]
+    elif original.startswith(corrected):
+        diffs = [(0, corrected), (-1, original[len(corrected):])]
+    # diff_main trims a common prefix first, so suffix-only edits match
+    # its output only when the texts share no prefix
+    elif original[0] == corrected[0]:
+        diffs = _dmp.diff_main(original, corrected)
+        _dmp.diff_cleanupSemantic(diffs)
+    elif corrected.endswith(original):
+        diffs = [(1, corrected[:-len(original)]), (0, original)]
+    elif original.endswith(corrected):
+        diffs = [(-1, original[:-len(corrected)]), (0, corrected)]
+    else:
+        diffs = _dmp.diff_main(original, corrected)
+        _dmp.diff_cleanupSemantic(diffs)
+
+    spans: list[dict] = []
+    append = spans.append
     orig_pos = 0
     corr_pos = 0
 
     for op, text in diffs:
+        n = len(text)
         if op == 0:  # EQUAL
-            spans.append({
+            append({
                 "type": "equal",
                 "text": text,
                 "orig_start": orig_pos,
-                "orig_end": orig_pos + len(text),
+                "orig_end": orig_pos + n,
                 "corr_start": corr_pos,
-                "corr_end": corr_pos + len(text),
+                "corr_end": corr_pos + n,
             })
-            orig_pos += len(text)
-            corr_pos += len(text)
+            orig_pos += n
+            corr_pos += n
         elif op == -1:  # DELETE
-            spans.append({
+            append({
                 "type": "delete",
                 "text": text,
                 "orig_start": orig_pos,
-                "orig_end": orig_pos + len(text),
+                "orig_end": orig_pos + n,
             })
-            orig_pos += len(text)
+            orig_pos += n
         elif op == 1:  # INSERT
-            spans.append({
+            append({
                 "type": "insert",
                 "text": text,
                 "corr_start": corr_pos,
-                "corr_end": corr_pos + len(text),
+                "corr_end": corr_pos + n,
             })
-            corr_pos += len(text)
+            corr_pos += n
 
     return spans
 
@@ -305,18 +331,15 @@ async def _correction_loop(
     for i in range(MAX_ITERATIONS):
         if i == 0:
             flag_instructions = _build_flag_instructions(scan_result)
-            prompt = CORRECTION_PROMPT.format(
-                principles=frozen_core.get_principles_prompt(),
-                text=text,
-                flag_instructions=flag_instructions,
-            )
+            prompt = "".join((
+                _CORRECTION_HEAD, flag_instructions, _CORRECTION_MID, text, _CORRECTION_TAIL,
+            ))
         else:
             surviving = _build_surviving_instructions(verification)
-            prompt = REFINEMENT_PROMPT.format(
-                iteration=i + 1,
-                surviving_flags=surviving,
-                text=current_text,
-            )
+            prompt = "".join((
+                _REFINEMENT_HEAD, str(i + 1), _REFINEMENT_MID, surviving,
+                _REFINEMENT_TEXT, current_text, _REFINEMENT_TAIL,
+            ))
 
         result = await llm.generate_json(prompt, temperature=0.3)
         corrected_text = result.get("corrected", current_text)
@@ -12,13 +12,21 @@ the scorer, and the learning ring.
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import logging
-
+import threading
+from collections import OrderedDict
 from typing import Optional
 
+import orjson
+import xxhash
+
+from biasclear.cache import deep_result_cache
 from biasclear.frozen_core import frozen_core, CoreEvaluation, CORE_VERSION
 from biasclear.scorer import calculate_truth_score
 from biasclear.llm import LLMProvider
+from biasclear.patterns.proposer import PatternProposer
 
 logger = logging.getLogger(__name__)
 
@@ -119,6 +127,32 @@ Return a JSON object with:
 Return ONLY valid JSON."""
 
 
+def _prefill_deep_prompt(domain_context: str) -> str:
+    # Principles and domain overlays are constant, so they're substituted
+    # once; only the local flags and the text vary per scan
+    return DEEP_ANALYSIS_PROMPT.format(
+        principles=frozen_core.get_principles_prompt(),
+        domain_context=domain_context,
+        text="{text}",
+        local_flags="{local_flags}",
+    )
+
+
+_DEEP_PROMPTS: dict[str, str] = {
+    domain: _prefill_deep_prompt(context) for domain, context in DOMAIN_CONTEXT.items()
+}
+_DEEP_PROMPT_DEFAULT = _prefill_deep_prompt("")
+
+
+def _deep_prompt(text: str, domain: str, local_flags: str) -> str:
+    # Text goes in last so placeholders inside user text are left alone
+    return (
+        _DEEP_PROMPTS.get(domain, _DEEP_PROMPT_DEFAULT)
+        .replace("{local_flags}", local_flags, 1)
+        .replace("{text}", text, 1)
+    )
+
+
 IMPACT_PROJECTION_PROMPT = """Based on the text and bias audit below, predict two divergent futures:
 
 1. PATH A — "The Trap": What happens if the reader accepts this biased framing?
@@ -139,11 +173,39 @@ Return ONLY valid JSON with:
 - "path_b_title": 3-6 word title for the leverage
 - "path_b_desc": 2-3 sentence description"""
 
+# Split once at the placeholders so each projection is a single join
+_IMPACT_HEAD, _rest = IMPACT_PROJECTION_PROMPT.split("{text}")
+_IMPACT_MID, _IMPACT_TAIL = _rest.split("{audit_summary}")
+del _rest
+
 
 # ============================================================
 # SCAN FUNCTIONS
 # ============================================================
 
+async def _evaluate(
+    text: str,
+    domain: str = "general",
+    external_patterns: Optional[list] = None,
+) -> CoreEvaluation:
+    """Run the frozen core's regex pass on a worker thread.
+
+    evaluate() only reads the compiled patterns, so it is safe off the
+    event loop, and other scans keep dispatching while it runs.
+    """
+    return await asyncio.to_thread(
+        frozen_core.evaluate,
+        text, domain=domain, external_patterns=external_patterns,
+    )
+
+
+# Local scans are deterministic, so results are memoized by text, domain
+# and pattern set. Entries hold the full text, hence the modest bound.
+_LOCAL_CACHE_SIZE = 256
+_local_cache: OrderedDict[tuple[int, bytes, str], tuple[Optional[tuple], dict]] = OrderedDict()
+_local_cache_lock = threading.Lock()
+
+
 async def scan_local(
     text: str,
     domain: str = "general",
@@ -152,25 +214,45 @@ async def scan_local(
     """
     Local-only scan. Frozen core + learning ring patterns.
     Zero API cost. Deterministic.
+
+    Repeat scans are served from a small LRU. Only an immutable pattern
+    set (None, or the learning ring's snapshot tuple) is cacheable; the
+    entry is tied to that exact snapshot object, so any activation or
+    deactivation misses. Callers get their own copy to mutate.
     """
-    core_eval = frozen_core.evaluate(
-        text, domain=domain, external_patterns=external_patterns,
-    )
+    cacheable = external_patterns is None or isinstance(external_patterns, tuple)
+    if cacheable:
+        key = (len(text), xxhash.xxh3_128_digest(text.encode()), domain)
+        with _local_cache_lock:
+            entry = _local_cache.get(key)
+            if entry is not None and entry[0] is external_patterns:
+                _local_cache.move_to_end(key)
+                return copy.deepcopy(entry[1])
+
+    core_eval = await _evaluate(text, domain, external_patterns)
     truth_score, score_breakdown = calculate_truth_score(core_eval)
 
-    return _build_result(
+    result = _build_result(
         text=text,
         core_eval=core_eval,
         truth_score=truth_score,
         scan_mode="local",
         score_breakdown=score_breakdown,
     )
+    if cacheable:
+        with _local_cache_lock:
+            _local_cache[key] = (external_patterns, copy.deepcopy(result))
+            _local_cache.move_to_end(key)
+            if len(_local_cache) > _LOCAL_CACHE_SIZE:
+                _local_cache.popitem(last=False)
+    return result
 
 
 async def scan_deep(
     text: str,
     llm: LLMProvider,
     domain: str = "general",
+    external_patterns: Optional[list] = None,
     learning_ring=None,
     audit_chain=None,
 ) -> dict:
@@ -178,25 +260,27 @@ async def scan_deep(
     Deep scan. LLM-powered analysis with frozen principles as context.
     When learning_ring is provided, novel patterns are proposed for learning.
     """
-    prompt = DEEP_ANALYSIS_PROMPT.format(
-        principles=frozen_core.get_principles_prompt(),
-        domain_context=DOMAIN_CONTEXT.get(domain, ""),
-        text=text,
-        local_flags="(none)",
+    prompt = _deep_prompt(text, domain, "(none)")
+
+    # The prompt carries no local flags, so the regex pass runs in a
+    # worker thread while the LLM call is in flight
+    core_eval, deep_result = await asyncio.gather(
+        _evaluate(text, domain, external_patterns),
+        _deep_analysis(llm, prompt),
+        return_exceptions=True,
     )
-
-    try:
-        deep_result = await llm.generate_json(prompt, temperature=0.2)
-    except Exception as e:
+    if isinstance(deep_result, Exception):
         return {
             "text": text,
-            "error": str(e),
+            "error": str(deep_result),
             "scan_mode": "deep",
             "source": "error",
         }
+    for outcome in (core_eval, deep_result):
+        if isinstance(outcome, BaseException):
+            raise outcome
 
     # Calculate truth score from deep result only
-    core_eval = frozen_core.evaluate(text, domain=domain)
     ai_flags = _extract_ai_flags(deep_result, [])
     truth_score, score_breakdown = calculate_truth_score(core_eval, deep_result, ai_flags)
 
@@ -214,23 +298,9 @@ async def scan_deep(
     result["self_scan"] = _self_scan(result.get("explanation", ""))
 
     # Self-learning loop — propose novel patterns
-    if learning_ring and deep_result and audit_chain:
-        try:
-            from biasclear.patterns.proposer import PatternProposer
-            proposer = PatternProposer(learning_ring)
-            proposals = await proposer.extract_and_propose(
-                text=text,
-                local_flags=result["flags"],
-                deep_result=deep_result,
-                llm=llm,
-                scan_audit_hash=result.get("audit_hash", "unknown"),
-            )
-            result["learning_proposals"] = proposals
-        except Exception:
-            logger.warning("Learning pattern proposal failed in scan_deep", exc_info=True)
-            result["learning_proposals"] = []
-    else:
-        result["learning_proposals"] = []
+    result["learning_proposals"] = await _propose_patterns(
+        text, result, deep_result, llm, learning_ring, audit_chain, "scan_deep",
+    )
 
     return result
 
@@ -251,27 +321,21 @@ async def scan_full(
     loop is active: novel patterns discovered by deep analysis are
     proposed to the learning ring for governed activation.
     """
-    # Phase 1: Local
-    core_eval = frozen_core.evaluate(
-        text, domain=domain, external_patterns=external_patterns,
-    )
+    # Phase 1: Local — runs before the LLM call because the prompt lists
+    # the local flags so the model doesn't re-report them
+    core_eval = await _evaluate(text, domain, external_patterns)
 
     # Build local flag summary for LLM deduplication
     local_flag_ids = [f.pattern_id for f in core_eval.flags]
     local_flags_str = ", ".join(local_flag_ids) if local_flag_ids else "(none)"
 
     # Phase 2: Deep — LLM as co-detector
-    prompt = DEEP_ANALYSIS_PROMPT.format(
-        principles=frozen_core.get_principles_prompt(),
-        domain_context=DOMAIN_CONTEXT.get(domain, ""),
-        text=text,
-        local_flags=local_flags_str,
-    )
+    prompt = _deep_prompt(text, domain, local_flags_str)
 
     deep_result = None
     _llm_failed = False
     try:
-        deep_result = await llm.generate_json(prompt, temperature=0.2)
+        deep_result = await _deep_analysis(llm, prompt)
     except Exception as e:
         logger.warning("LLM co-detection failed: %s", e)
         _llm_failed = True
@@ -287,38 +351,17 @@ async def scan_full(
         truth_score = 85
         score_breakdown["final_score"] = truth_score
 
-    # Phase 4: Impact projection (only if truth_score < 80)
-    impact = None
-    if truth_score < 80 and deep_result:
-        audit_summary = (
-            f"Severity: {deep_result.get('severity', 'unknown')}, "
-            f"Bias types: {', '.join(deep_result.get('bias_types', []))}, "
-            f"PIT Tier: {deep_result.get('pit_tier', 'none')}, "
-            f"Explanation: {deep_result.get('explanation', '')}"
-        )
-        try:
-            impact = await llm.generate_json(
-                IMPACT_PROJECTION_PROMPT.format(
-                    text=text, audit_summary=audit_summary,
-                ),
-                temperature=0.7,
-            )
-        except Exception:
-            logger.warning("Impact scoring failed in scan_full", exc_info=True)
-            impact = None
-
     result = _build_result(
         text=text,
         core_eval=core_eval,
         truth_score=truth_score,
         scan_mode="full",
         deep_result=deep_result,
-        impact_projection=impact,
         ai_flags=ai_flags,
         score_breakdown=score_breakdown,
     )
 
-    # Phase 5: Degradation warning when LLM failed
+    # Phase 4: Degradation warning when LLM failed
     if _llm_failed:
         result["degraded"] = True
         result["degradation_warning"] = (
@@ -327,31 +370,92 @@ async def scan_full(
             "Truth score has been capped at 85."
         )
 
-    # Phase 6: Self-scan — check the LLM's own explanation for bias
+    # Phase 5: Self-scan — check the LLM's own explanation for bias
     result["self_scan"] = _self_scan(result.get("explanation", ""))
 
-    # Phase 7: Self-learning loop — propose novel patterns
-    if learning_ring and deep_result and audit_chain:
-        try:
-            from biasclear.patterns.proposer import PatternProposer
-            proposer = PatternProposer(learning_ring)
-            proposals = await proposer.extract_and_propose(
-                text=text,
-                local_flags=result["flags"],
-                deep_result=deep_result,
-                llm=llm,
-                scan_audit_hash=result.get("audit_hash", "unknown"),
-            )
-            result["learning_proposals"] = proposals
-        except Exception:
-            logger.warning("Learning pattern proposal failed in scan_full", exc_info=True)
-            result["learning_proposals"] = []
-    else:
-        result["learning_proposals"] = []
+    # Phase 6: Impact projection (only if truth_score < 80) and the
+    # self-learning loop. Both need only the deep result and merged flags,
+    # so their LLM calls run concurrently.
+    impact, proposals = await asyncio.gather(
+        _project_impact(text, deep_result, llm) if truth_score < 80 else _no_impact(),
+        _propose_patterns(
+            text, result, deep_result, llm, learning_ring, audit_chain, "scan_full",
+        ),
+    )
+    result["impact_projection"] = _format_impact(impact)
+    result["learning_proposals"] = proposals
 
     return result
 
 
+async def _deep_analysis(llm: LLMProvider, prompt: str) -> dict:
+    """Run the deep-analysis LLM call, reusing the answer to an identical prompt.
+
+    Exact match only: a near-duplicate text can differ in exactly the
+    words that carry the bias, and AI flags must quote the scanned text.
+    Entries are stored serialized so every hit gets fresh objects.
+    """
+    cached = await deep_result_cache.get(prompt, "", "deep_analysis")
+    if cached is not None:
+        return orjson.loads(cached)
+    deep_result = await llm.generate_json(prompt, temperature=0.2)
+    if isinstance(deep_result, dict):
+        await deep_result_cache.put(prompt, "", "deep_analysis", orjson.dumps(deep_result))
+    return deep_result
+
+
+async def _project_impact(
+    text: str, deep_result: Optional[dict], llm: LLMProvider,
+) -> Optional[dict]:
+    """Ask the LLM for the trap/leverage futures of a biased text."""
+    if not deep_result:
+        return None
+    get = deep_result.get
+    # f-string fields tolerate nulls or numbers in the model's JSON
+    audit_summary = (
+        f"Severity: {get('severity', 'unknown')}, "
+        f"Bias types: {', '.join(get('bias_types', ()))}, "
+        f"PIT Tier: {get('pit_tier', 'none')}, "
+        f"Explanation: {get('explanation', '')}"
+    )
+    prompt = "".join((_IMPACT_HEAD, text, _IMPACT_MID, audit_summary, _IMPACT_TAIL))
+    try:
+        return await llm.generate_json(prompt, temperature=0.7)
+    except Exception:
+        logger.warning("Impact scoring failed in scan_full", exc_info=True)
+        return None
+
+
+async def _no_impact() -> None:
+    return None
+
+
+async def _propose_patterns(
+    text: str,
+    result: dict,
+    deep_result: Optional[dict],
+    llm: LLMProvider,
+    learning_ring,
+    audit_chain,
+    caller: str,
+) -> list[dict]:
+    """Propose novel patterns from deep analysis to the learning ring."""
+    if not (learning_ring and deep_result and audit_chain):
+        return []
+    try:
+        proposer = PatternProposer(learning_ring)
+        return await proposer.extract_and_propose(
+            text=text,
+            local_flags=result["flags"],
+            deep_result=deep_result,
+            llm=llm,
+            scan_audit_hash=result.get("audit_hash", "unknown"),
+        )
+    except Exception:
+        logger.warning("Learning pattern proposal failed in %s", caller, exc_info=True)
+        return []
+
+
 def _self_scan(explanation: str) -> Optional[dict]:
     """
     Self-scan: run the frozen core on the LLM's own explanation.
@@ -391,6 +495,22 @@ def _self_scan(explanation: str) -> Optional[dict]:
         return None
 
 
+def _format_impact(impact_projection: Optional[dict]) -> Optional[dict]:
+    """Shape a raw impact projection into the path_a/path_b response form."""
+    if not impact_projection:
+        return None
+    return {
+        "path_a": {
+            "title": impact_projection.get("path_a_title", ""),
+            "description": impact_projection.get("path_a_desc", ""),
+        },
+        "path_b": {
+            "title": impact_projection.get("path_b_title", ""),
+            "description": impact_projection.get("path_b_desc", ""),
+        },
+    }
+
+
 def _extract_ai_flags(
     deep_result: Optional[dict],
     local_flag_ids: list[str],
@@ -452,39 +572,54 @@ def _extract_ai_flags(
 # RESULT BUILDER
 # ============================================================
 
+_SEVERITY_RANK = {"critical": 4, "high": 3, "moderate": 2, "low": 1}
+_SEVERITY_BY_RANK = ("none", "low", "moderate", "high", "critical")
+
+
 def _build_result(
     text: str,
     core_eval: CoreEvaluation,
     truth_score: int,
     scan_mode: str,
     deep_result: Optional[dict] = None,
-    impact_projection: Optional[dict] = None,
     ai_flags: Optional[list[dict]] = None,
     score_breakdown: Optional[dict] = None,
 ) -> dict:
     """Build a unified scan result from local + deep + AI flags."""
     ai_flags = ai_flags or []
 
-    # Merge bias types from both sources
-    local_bias_types = list(set(f.pattern_id for f in core_eval.flags))
-    deep_bias_types = []
+    # One pass over core flags: serialized flags (source: core), the
+    # ordered-unique pattern IDs, and the worst severity seen
+    bias_types: dict[str, None] = {}
+    worst = 0
+    merged_flags = []
+    for f in core_eval.flags:
+        bias_types[f.pattern_id] = None
+        worst = max(worst, _SEVERITY_RANK.get(f.severity, 0))
+        merged_flags.append({
+            "category": f.category,
+            "pattern_id": f.pattern_id,
+            "matched_text": f.matched_text,
+            "pit_tier": f.pit_tier,
+            "severity": f.severity,
+            "description": f.description,
+            "source": "core",
+        })
+    # AI flags (source: ai) follow the core flags
+    merged_flags.extend(ai_flags)
+
+    # Merge bias types from both sources, first-seen order
     if deep_result:
-        deep_bias_types = [
-            b for b in deep_result.get("bias_types", []) if b != "none"
-        ]
+        for b in deep_result.get("bias_types", []):
+            if b != "none":
+                bias_types[b] = None
 
     # Determine overall severity — worst of core, AI, and deep
-    all_severities = [f.severity for f in core_eval.flags]
-    all_severities.extend(f["severity"] for f in ai_flags)
-    if deep_result and deep_result.get("severity"):
-        all_severities.append(deep_result["severity"])
-
-    severity_order = ["critical", "high", "moderate", "low", "none"]
-    severity = "none"
-    for s in severity_order:
-        if s in all_severities:
-            severity = s
-            break
+    for f in ai_flags:
+        worst = max(worst, _SEVERITY_RANK.get(f["severity"], 0))
+    if deep_result:
+        worst = max(worst, _SEVERITY_RANK.get(deep_result.get("severity"), 0))
+    severity = _SEVERITY_BY_RANK[worst]
 
     # Merge explanation
     explanation = core_eval.summary
@@ -510,21 +645,6 @@ def _build_result(
     if deep_result and deep_result.get("knowledge_type"):
         knowledge_type = deep_result["knowledge_type"]
 
-    # Build merged flags: core flags (source: core) + AI flags (source: ai)
-    core_flags = [
-        {
-            "category": f.category,
-            "pattern_id": f.pattern_id,
-            "matched_text": f.matched_text,
-            "pit_tier": f.pit_tier,
-            "severity": f.severity,
-            "description": f.description,
-            "source": "core",
-        }
-        for f in core_eval.flags
-    ]
-    merged_flags = core_flags + ai_flags
-
     return {
         "text": text,
         "truth_score": truth_score,
@@ -532,27 +652,14 @@ def _build_result(
         "bias_detected": len(merged_flags) > 0 or (
             deep_result.get("bias_detected", False) if deep_result else False
         ),
-        "bias_types": list(set(local_bias_types + deep_bias_types)),
+        "bias_types": list(bias_types),
         "pit_tier": pit_tier,
         "pit_detail": pit_detail,
         "severity": severity,
         "confidence": round(confidence, 3),
         "explanation": explanation,
         "flags": merged_flags,
-        "impact_projection": (
-            {
-                "path_a": {
-                    "title": impact_projection.get("path_a_title", ""),
-                    "description": impact_projection.get("path_a_desc", ""),
-                },
-                "path_b": {
-                    "title": impact_projection.get("path_b_title", ""),
-                    "description": impact_projection.get("path_b_desc", ""),
-                },
-            }
-            if impact_projection
-            else None
-        ),
+        "impact_projection": None,
         "scan_mode": scan_mode,
         "source": "local" if scan_mode == "local" else (
             "llm+local" if deep_result else "local_fallback"
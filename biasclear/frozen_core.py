@@ -70,7 +70,7 @@ def _regex_with_timeout(pattern: str, text: str, timeout: int = 2) -> list[str]:
 # DATA STRUCTURES
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class Flag:
     """A single detection flag raised during evaluation."""
     category: str          # e.g., "structural", "marker", "legal"
@@ -81,7 +81,7 @@ class Flag:
     description: str       # Human-readable explanation
 
 
-@dataclass
+@dataclass(slots=True)
 class CoreEvaluation:
     """Result of a frozen core evaluation."""
     aligned: bool
@@ -178,7 +178,7 @@ PIT_TIERS = {
 # STRUCTURAL DETECTION PATTERNS (The real detection engine)
 # ============================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StructuralPattern:
     """
     A structural detection pattern. Unlike keyword markers, these
@@ -1378,6 +1378,18 @@ class FrozenCore:
         self._media_patterns = MEDIA_STRUCTURAL_PATTERNS
         self._financial_patterns = FINANCIAL_STRUCTURAL_PATTERNS
         self._keyword_markers = SENSE_KNOWLEDGE_MARKERS
+        self._principles_prompt = self._build_principles_prompt()
+        # Frozen indicators are vetted and can't change, so they're compiled
+        # once and run inline; only learned regexes need the timeout guard
+        self._compiled_indicators: dict[str, re.Pattern] = {
+            indicator: re.compile(indicator, re.IGNORECASE | re.DOTALL)
+            for patterns in (
+                self._base_patterns, self._legal_patterns,
+                self._media_patterns, self._financial_patterns,
+            )
+            for pattern in patterns
+            for indicator in pattern.indicators
+        }
 
     def evaluate(
         self,
@@ -1476,8 +1488,11 @@ class FrozenCore:
         """Match a structural pattern against text. Returns matched fragments."""
         matches = []
         for indicator_regex in pattern.indicators:
-            found = _regex_with_timeout(indicator_regex, text)
-            matches.extend(found)
+            compiled = self._compiled_indicators.get(indicator_regex)
+            if compiled is not None:
+                matches.extend(compiled.findall(text))
+            else:
+                matches.extend(_regex_with_timeout(indicator_regex, text))
         return matches if len(matches) >= pattern.min_matches else []
 
     # Citation patterns for context-aware suppression
@@ -1624,7 +1639,7 @@ class FrozenCore:
 
         parts = []
         if structural:
-            names = list(set(f.pattern_id for f in structural))
+            names = list(dict.fromkeys(f.pattern_id for f in structural))
             parts.append(
                 f"Detected {len(structural)} structural distortion(s): "
                 f"{', '.join(names)}."
@@ -1679,6 +1694,11 @@ class FrozenCore:
         Return the frozen principles formatted for LLM system prompt injection.
         Used by the deep analysis layer (detector.py) when calling the LLM.
         """
+        return self._principles_prompt
+
+    @staticmethod
+    def _build_principles_prompt() -> str:
+        # Principles and tiers are frozen, so this is built once per process
         lines = ["## BiasClear Frozen Core Principles (Immutable)\n"]
         for name, p in PRINCIPLES.items():
             lines.append(f"### {name}")
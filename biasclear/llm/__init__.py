@@ -7,13 +7,96 @@ by changing BIASCLEAR_LLM_PROVIDER in env.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
+import orjson
+
 logger = logging.getLogger("biasclear.llm")
 
+# ---------------------------------------------------------------------------
+# Dedicated executor for blocking SDK calls (boto3)
+# ---------------------------------------------------------------------------
+# Keeps slow LLM round-trips out of the default thread pool that Starlette
+# uses for sync dependencies, and doubles as a cap on in-flight LLM calls.
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_llm_executor() -> ThreadPoolExecutor:
+    """Return the shared LLM executor, creating it on first use."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                from biasclear.config import settings
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.LLM_MAX_INFLIGHT,
+                    thread_name_prefix="biasclear-llm",
+                )
+    return _executor
+
+
+def shutdown_llm_executor() -> None:
+    """Shut down the LLM executor (app shutdown). Recreated lazily if reused."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+# ---------------------------------------------------------------------------
+# Request pacing — one RPM budget shared by every upstream call
+# ---------------------------------------------------------------------------
+# Concurrency caps bound how many calls are in flight, not how fast they
+# start; a burst of short calls can still blow through the provider's
+# per-minute quota and fall into the retry backoff.
+
+
+class RequestPacer:
+    """Space upstream requests to stay under a requests-per-minute quota.
+
+    Each call reserves the next start slot (GCRA), sleeping until it
+    comes up; up to one second's worth of quota may start at once. The
+    state is a float touched only on the event loop, so the pacer is not
+    bound to any particular loop.
+    """
+
+    def __init__(self, per_minute: int):
+        self.interval = 60.0 / per_minute
+        self._tolerance = (max(1.0, per_minute / 60) - 1) * self.interval
+        self._tat = 0.0  # Theoretical arrival time of the next request
+
+    async def wait(self) -> None:
+        now = time.monotonic()
+        tat = max(self._tat, now)
+        self._tat = tat + self.interval
+        start = tat - self._tolerance
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+_pacer: Optional[RequestPacer] = None
+_pacer_loaded = False
+
+
+async def pace_llm_request() -> None:
+    """Wait for a slot under BIASCLEAR_LLM_MAX_RPM (no-op when unset)."""
+    global _pacer, _pacer_loaded
+    if not _pacer_loaded:
+        from biasclear.config import settings
+        if settings.LLM_MAX_RPM > 0:
+            _pacer = RequestPacer(settings.LLM_MAX_RPM)
+        _pacer_loaded = True
+    if _pacer is not None:
+        await _pacer.wait()
+
 # ---------------------------------------------------------------------------
 # Circuit breaker — shared across all providers
 # ---------------------------------------------------------------------------
@@ -79,6 +162,14 @@ class CircuitOpenError(Exception):
 class LLMProvider(ABC):
     """Abstract base for LLM providers."""
 
+    def warm_up(self) -> None:
+        """Build SDK clients ahead of the first request (blocking; may be slow).
+
+        Called once at startup from the LLM executor. Must not make a
+        network call or raise for missing credentials — that is left to
+        the first real request.
+        """
+
     @abstractmethod
     async def generate(
         self,
@@ -97,20 +188,25 @@ class LLMProvider(ABC):
         temperature: float = 0.3,
     ) -> dict:
         """Generate and parse a JSON response."""
-        import json
         text = await self.generate(
             prompt=prompt,
             system_instruction=system_instruction,
             temperature=temperature,
             json_mode=True,
         )
-        # Strip markdown fences if the LLM wraps JSON in ```json blocks
+        # Strip markdown fences if the LLM wraps JSON in ```json blocks:
+        # drop the opening fence line and everything from the last fence,
+        # slicing once instead of building split/rsplit intermediates
         cleaned = text.strip()
         if cleaned.startswith("```"):
-            cleaned = cleaned.split("\n", 1)[-1].rsplit("```", 1)[0].strip()
+            start = cleaned.find("\n") + 1
+            end = cleaned.rfind("```")
+            if end < start:
+                end = len(cleaned)  # No closing fence
+            cleaned = cleaned[start:end].strip()
         try:
-            return json.loads(cleaned)
-        except json.JSONDecodeError as e:
+            return orjson.loads(cleaned)
+        except orjson.JSONDecodeError as e:
             raise ValueError(
                 f"LLM returned invalid JSON: {e}. Raw response: {text[:300]}"
             ) from e
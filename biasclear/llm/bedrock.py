@@ -7,7 +7,7 @@ standard AWS credential chain (env vars, ~/.aws/credentials, IAM role).
 Features:
 - Circuit breaker: after consecutive failures, return local-only signal for 60s
 - Exponential backoff retry on transient errors
-- Async wrapper around synchronous boto3 calls
+- Async wrapper around synchronous boto3 calls (dedicated bounded executor)
 """
 
 from __future__ import annotations
@@ -15,12 +15,28 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import random
+import re
 from typing import Optional
 
-from biasclear.llm import CircuitBreaker, CircuitOpenError, LLMProvider
+from biasclear.llm import (
+    CircuitBreaker,
+    CircuitOpenError,
+    LLMProvider,
+    get_llm_executor,
+    pace_llm_request,
+)
 
 logger = logging.getLogger("biasclear.llm.bedrock")
 
+# Throttling and server-side errors worth retrying, matched in one
+# case-insensitive scan of the exception message
+_TRANSIENT_RE = re.compile(
+    r"throttling|429|503|500|rate|timeout|connection|unavailable"
+    r"|overloaded|too many requests|serviceunav|internalserver",
+    re.IGNORECASE,
+)
+
 
 class BedrockProvider(LLMProvider):
     """Amazon Bedrock LLM provider using the Converse API."""
@@ -55,6 +71,11 @@ class BedrockProvider(LLMProvider):
             )
         return self._client
 
+    def warm_up(self) -> None:
+        # boto3 client construction loads service models from disk —
+        # the bulk of the first-call latency
+        self._get_client()
+
     def _call_converse(
         self,
         prompt: str,
@@ -107,9 +128,12 @@ class BedrockProvider(LLMProvider):
     ) -> str:
         """Call Bedrock with retry logic for transient errors."""
         last_error = None
+        loop = asyncio.get_running_loop()
         for attempt in range(max_retries):
+            await pace_llm_request()
             try:
-                result = await asyncio.to_thread(
+                result = await loop.run_in_executor(
+                    get_llm_executor(),
                     self._call_converse,
                     prompt,
                     system_instruction,
@@ -119,19 +143,13 @@ class BedrockProvider(LLMProvider):
                 return result
             except Exception as e:
                 last_error = e
-                error_str = str(e).lower()
-                is_transient = any(k in error_str for k in [
-                    "throttling", "429", "503", "500", "rate",
-                    "timeout", "connection", "unavailable",
-                    "overloaded", "too many requests",
-                    "serviceunav", "internalserver",
-                ])
-                if is_transient and attempt < max_retries - 1:
+                if _TRANSIENT_RE.search(str(e)) and attempt < max_retries - 1:
                     logger.warning(
                         "Bedrock transient error (attempt %d/%d): %s",
                         attempt + 1, max_retries, e,
                     )
-                    await asyncio.sleep(2 ** attempt)
+                    # Jittered so concurrent callers don't retry in lockstep
+                    await asyncio.sleep((2 ** attempt) * random.uniform(0.5, 1.5))
                     continue
                 raise
 
@@ -6,6 +6,7 @@ Supports automatic fallback: if the primary provider fails on first call,
 the factory can return the other provider as a fallback.
 """
 
+import functools
 import logging
 import os
 
@@ -14,8 +15,13 @@ from biasclear.llm import LLMProvider
 logger = logging.getLogger("biasclear.llm.factory")
 
 
+@functools.cache
 def get_provider(provider_name: str = "bedrock") -> LLMProvider:
-    """Factory — returns the configured LLM provider."""
+    """Factory — returns the configured LLM provider.
+
+    Providers are built once per name, so every caller shares one SDK
+    client, connection pool and circuit breaker per upstream.
+    """
     if provider_name == "gemini":
         from biasclear.llm.gemini import GeminiProvider
         return GeminiProvider()
@@ -68,6 +74,10 @@ class _FallbackProvider(LLMProvider):
             self._fallback = get_provider(self._fallback_name)
         return self._fallback
 
+    def warm_up(self) -> None:
+        # The fallback stays lazy — it is only built if the primary fails
+        self._primary.warm_up()
+
     @property
     def circuit_breaker(self):
         """Expose circuit breaker from the active provider."""
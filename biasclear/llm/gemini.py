@@ -13,19 +13,83 @@ Features:
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import os
+import random
+import re
 from typing import Optional
 
 from google import genai
+from google.genai import errors as genai_errors
 from google.genai import types
 
-from biasclear.llm import CircuitBreaker, CircuitOpenError, LLMProvider
+from biasclear.llm import CircuitBreaker, CircuitOpenError, LLMProvider, pace_llm_request
 
 logger = logging.getLogger("biasclear.llm.gemini")
 
 FALLBACK_MODEL = "gemini-2.5-flash"
 
+# API errors carry an HTTP status; anything else (network, SDK) is
+# classified by its message in one case-insensitive scan
+_TRANSIENT_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+_TRANSIENT_RE = re.compile(
+    r"429|503|500|rate|quota|timeout|connection|unavailable|overloaded",
+    re.IGNORECASE,
+)
+
+
+def _is_transient(e: Exception) -> bool:
+    if isinstance(e, genai_errors.APIError):
+        return e.code in _TRANSIENT_STATUS
+    return _TRANSIENT_RE.search(str(e)) is not None
+
+
+# A server that asks for a longer pause than this gets no retry — the
+# caller's fallback beats holding the request open
+_MAX_RETRY_DELAY = 30.0
+
+
+def _server_retry_hint(e: Exception) -> Optional[float]:
+    """Seconds the API asked us to wait (Retry-After header or RetryInfo detail)."""
+    if not isinstance(e, genai_errors.APIError):
+        return None
+    headers = getattr(e.response, "headers", None)
+    if headers is not None:
+        try:
+            return float(headers.get("retry-after", ""))
+        except ValueError:
+            pass  # Absent, or the HTTP-date form
+    error = e.details.get("error") if isinstance(e.details, dict) else None
+    for detail in (error or {}).get("details") or ():
+        if isinstance(detail, dict) and str(detail.get("@type", "")).endswith("RetryInfo"):
+            try:
+                return float(str(detail.get("retryDelay", "")).rstrip("s"))
+            except ValueError:
+                return None
+    return None
+
+
+def _retry_delay(e: Exception, attempt: int) -> Optional[float]:
+    """Jittered exponential backoff, stretched to any server hint; None to give up."""
+    delay = (2 ** attempt) * random.uniform(0.5, 1.5)
+    hint = _server_retry_hint(e)
+    if hint is not None:
+        if hint > _MAX_RETRY_DELAY:
+            return None
+        delay = max(delay, hint)
+    return delay
+
+
+@functools.cache
+def _shared_client(api_key: str) -> genai.Client:
+    """One client (and HTTP connection pool) per API key for the process."""
+    # Same 30s read bound as the Bedrock client, so a hung call can't
+    # hold a request open indefinitely
+    return genai.Client(
+        api_key=api_key, http_options=types.HttpOptions(timeout=30_000),
+    )
+
 
 class GeminiProvider(LLMProvider):
     """Google Gemini LLM provider with fallback and circuit breaker."""
@@ -43,9 +107,13 @@ class GeminiProvider(LLMProvider):
                     "GEMINI_API_KEY not set. Get one from "
                     "https://aistudio.google.com/apikey"
                 )
-            self._client = genai.Client(api_key=self._api_key)
+            self._client = _shared_client(self._api_key)
         return self._client
 
+    def warm_up(self) -> None:
+        if self._api_key:
+            self._get_client()
+
     async def _call_model(
         self,
         model: str,
@@ -57,6 +125,7 @@ class GeminiProvider(LLMProvider):
         client = self._get_client()
         last_error = None
         for attempt in range(max_retries):
+            await pace_llm_request()
             try:
                 response = await client.aio.models.generate_content(
                     model=model,
@@ -66,14 +135,11 @@ class GeminiProvider(LLMProvider):
                 return response.text
             except Exception as e:
                 last_error = e
-                error_str = str(e).lower()
-                is_transient = any(k in error_str for k in [
-                    "429", "503", "500", "rate", "quota", "timeout",
-                    "connection", "unavailable", "overloaded",
-                ])
-                if is_transient and attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)
-                    continue
+                if _is_transient(e) and attempt < max_retries - 1:
+                    delay = _retry_delay(e, attempt)
+                    if delay is not None:
+                        await asyncio.sleep(delay)
+                        continue
                 raise
 
         raise last_error  # type: ignore[misc]
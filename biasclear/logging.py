@@ -13,34 +13,47 @@ Usage:
 
 from __future__ import annotations
 
-import json
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 from datetime import datetime, timezone
+from typing import Optional
+
+import orjson
 
 
 LOG_LEVEL = os.getenv("BIASCLEAR_LOG_LEVEL", "INFO").upper()
 LOG_FORMAT = os.getenv("BIASCLEAR_LOG_FORMAT", "json")  # "json" or "text"
 
 
+# Context fields copied from `extra=` into each JSON line
+_EXTRA_FIELDS = (
+    "truth_score", "domain", "scan_mode", "flags_count",
+    "audit_hash", "key_id", "pattern_id", "error",
+    "duration_ms", "status_code", "method", "path",
+    "email", "error_type",
+)
+
+
 class JSONFormatter(logging.Formatter):
     """Formats log records as JSON lines."""
 
     def format(self, record: logging.LogRecord) -> str:
         entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            # orjson renders aware datetimes exactly as isoformat() does
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
 
         # Include extra fields
-        for key in ("truth_score", "domain", "scan_mode", "flags_count",
-                     "audit_hash", "key_id", "pattern_id", "error",
-                     "duration_ms", "status_code", "method", "path",
-                     "email", "error_type"):
-            val = getattr(record, key, None)
+        attrs = record.__dict__
+        for key in _EXTRA_FIELDS:
+            val = attrs.get(key)
             if val is not None:
                 entry[key] = val
 
@@ -48,7 +61,7 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info and record.exc_info[0]:
             entry["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(entry, default=str)
+        return orjson.dumps(entry, default=str).decode()
 
 
 class TextFormatter(logging.Formatter):
@@ -61,13 +74,37 @@ class TextFormatter(logging.Formatter):
         )
 
 
+class _EnqueueHandler(logging.handlers.QueueHandler):
+    """Enqueue records without formatting them on the calling thread.
+
+    The stock QueueHandler.prepare() runs the full formatter (and folds
+    tracebacks into the message) so records can be pickled. Our queue is
+    in-process, so only the message args are merged; JSON formatting and
+    exc_info rendering happen on the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
 def setup_logging():
-    """Configure root logger. Call once at app startup."""
+    """Configure root logger. Call once at app startup.
+
+    Records are handed to a background QueueListener, so the event loop
+    only pays for building the LogRecord — never for formatting or I/O.
+    """
+    global _listener
     root = logging.getLogger("biasclear")
     root.setLevel(getattr(logging, LOG_LEVEL, logging.INFO))
 
-    # Clear existing handlers
+    # Clear existing handlers (and a listener from a previous call)
     root.handlers.clear()
+    shutdown_logging()
 
     handler = logging.StreamHandler(sys.stdout)
     if LOG_FORMAT == "json":
@@ -75,7 +112,10 @@ def setup_logging():
     else:
         handler.setFormatter(TextFormatter())
 
-    root.addHandler(handler)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(log_queue, handler)
+    _listener.start()
+    root.addHandler(_EnqueueHandler(log_queue))
 
     # Suppress noisy third-party loggers
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
@@ -84,6 +124,17 @@ def setup_logging():
     return root
 
 
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a named logger under the biasclear namespace."""
     return logging.getLogger(f"biasclear.{name}")
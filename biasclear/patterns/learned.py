@@ -27,6 +27,7 @@ import logging
 import os
 import sqlite3
 import threading
+from collections import Counter
 
 logger = logging.getLogger("biasclear.patterns.learned")
 from dataclasses import dataclass
@@ -82,7 +83,21 @@ class LearningRing:
         self.fp_limit = fp_limit
         self.json_path = json_path
         self._lock = threading.Lock()
+        self._tls = threading.local()
+        self._conns: list[sqlite3.Connection] = []
+        self._conns_lock = threading.Lock()
+        # Evaluation counts buffered in memory, written in one transaction
+        self._eval_buffer: Counter[str] = Counter()
+        self._eval_pending = 0
+        self._buffer_lock = threading.Lock()
         self._audit_fn = None  # Set by app startup to wire in audit logger
+        # Active-pattern snapshot, rebuilt lazily after any status change.
+        # _version is bumped on every change so callers can key caches on it.
+        self._active_snapshot: Optional[tuple[StructuralPattern, ...]] = None
+        self._version = 0
+        # Per-status pattern counts, recomputed lazily after any transition
+        self._status_counts: Optional[dict[str, int]] = None
+        self._status_epoch = 0
         self._init_db()
         self._load_from_json()
 
@@ -92,6 +107,9 @@ class LearningRing:
 
     def _init_db(self):
         with self._get_conn() as conn:
+            # WAL persists in the database file: readers stop blocking on
+            # proposals and commits become sequential log appends
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS learned_patterns (
                     pattern_id TEXT PRIMARY KEY,
@@ -111,10 +129,59 @@ class LearningRing:
                     source_scan_hash TEXT NOT NULL
                 )
             """)
+            # Serves the active-pattern load and the per-status counts
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_lp_status
+                ON learned_patterns(status)
+            """)
+            # Serves get_all_patterns' newest-first listing
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_lp_proposed_at
+                ON learned_patterns(proposed_at)
+            """)
             conn.commit()
 
     def _get_conn(self) -> sqlite3.Connection:
-        return sqlite3.connect(self.db_path)
+        """Per-thread connection, opened once and reused.
+
+        Used as `with conn:`, which commits or rolls back but leaves the
+        connection open. synchronous=NORMAL is safe under WAL: a power
+        loss can drop the last commits, never corrupt the database.
+        """
+        conn = getattr(self._tls, "conn", None)
+        if conn is None:
+            # check_same_thread=False only so close_connections() can close
+            # it from the shutdown thread; each connection is used by its owner.
+            conn = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._tls.conn = conn
+            with self._conns_lock:
+                self._conns.append(conn)
+        return conn
+
+    def close_connections(self) -> None:
+        """Close every per-thread connection; threads reopen lazily on next use."""
+        with self._conns_lock:
+            conns, self._conns = self._conns, []
+        for conn in conns:
+            conn.close()
+        self._tls = threading.local()
+
+    def _invalidate_active(self) -> None:
+        """Drop the active-pattern snapshot after a status change."""
+        self._version += 1
+        self._active_snapshot = None
+        self._invalidate_counts()
+
+    def _invalidate_counts(self) -> None:
+        """Drop cached status counts after a pattern is added or moved."""
+        self._status_epoch += 1
+        self._status_counts = None
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter of active-set changes (for cache keys)."""
+        return self._version
 
     def _audit(self, event_type: str, data: dict) -> Optional[str]:
         """Log to audit chain if logger is wired."""
@@ -218,55 +285,54 @@ class LearningRing:
 
         with self._lock:
             with self._get_conn() as conn:
-                existing = conn.execute(
-                    "SELECT pattern_id, status, confirmations FROM learned_patterns WHERE pattern_id = ?",
-                    (pattern_id,),
-                ).fetchone()
-
-                if existing:
-                    # Pattern already proposed — increment confirmations
-                    old_confirmations = existing[2]
-                    new_confirmations = old_confirmations + 1
-                    conn.execute(
-                        "UPDATE learned_patterns SET confirmations = ? WHERE pattern_id = ?",
-                        (new_confirmations, pattern_id),
-                    )
+                # One upsert: inserts a new staging pattern or bumps an
+                # existing one's confirmations (SQLite >= 3.35 for RETURNING)
+                status, confirmations = conn.execute(
+                    """INSERT INTO learned_patterns
+                       (pattern_id, name, description, pit_tier, severity,
+                        principle, regex, status, confirmations,
+                        false_positives, total_evaluations,
+                        proposed_at, source_scan_hash)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, 'staging', 1, 0, 0, ?, ?)
+                       ON CONFLICT(pattern_id)
+                       DO UPDATE SET confirmations = confirmations + 1
+                       RETURNING status, confirmations""",
+                    (
+                        pattern_id, name, description, pit_tier, severity,
+                        principle, regex, now, source_scan_hash,
+                    ),
+                ).fetchall()[0]
+
+                if confirmations > 1:
+                    # Pattern already proposed — confirmations incremented.
+                    # Auto-activation commits in the same transaction.
+                    activated_at = None
+                    if (
+                        status == "staging"
+                        and confirmations >= self.activation_threshold
+                    ):
+                        activated_at = self._mark_active(conn, pattern_id)
                     conn.commit()
 
                     self._audit("pattern_confirmed", {
                         "pattern_id": pattern_id,
-                        "confirmations": new_confirmations,
+                        "confirmations": confirmations,
                         "source_scan_hash": source_scan_hash,
                     })
 
-                    # Check for auto-activation
-                    if (
-                        existing[1] == "staging"
-                        and new_confirmations >= self.activation_threshold
-                    ):
-                        return self._activate(conn, pattern_id)
+                    if activated_at is not None:
+                        return self._activated(pattern_id, activated_at)
 
                     return {
                         "accepted": True,
                         "action": "confirmed",
-                        "confirmations": new_confirmations,
+                        "confirmations": confirmations,
                         "threshold": self.activation_threshold,
                     }
                 else:
-                    # New pattern — insert as staging
-                    conn.execute(
-                        """INSERT INTO learned_patterns
-                           (pattern_id, name, description, pit_tier, severity,
-                            principle, regex, status, confirmations,
-                            false_positives, total_evaluations,
-                            proposed_at, source_scan_hash)
-                           VALUES (?, ?, ?, ?, ?, ?, ?, 'staging', 1, 0, 0, ?, ?)""",
-                        (
-                            pattern_id, name, description, pit_tier, severity,
-                            principle, regex, now, source_scan_hash,
-                        ),
-                    )
+                    # New pattern — inserted as staging
                     conn.commit()
+                    self._invalidate_counts()
 
                     self._audit("pattern_proposed", {
                         "pattern_id": pattern_id,
@@ -285,14 +351,19 @@ class LearningRing:
                         "threshold": self.activation_threshold,
                     }
 
-    def _activate(self, conn: sqlite3.Connection, pattern_id: str) -> dict:
-        """Activate a staging pattern that has reached the confirmation threshold."""
+    @staticmethod
+    def _mark_active(conn: sqlite3.Connection, pattern_id: str) -> str:
+        """Promote a staging pattern inside the caller's transaction."""
         now = datetime.now(timezone.utc).isoformat()
         conn.execute(
             "UPDATE learned_patterns SET status = 'active', activated_at = ? WHERE pattern_id = ?",
             (now, pattern_id),
         )
-        conn.commit()
+        return now
+
+    def _activated(self, pattern_id: str, now: str) -> dict:
+        """Publish a committed activation: snapshot, audit, JSON export."""
+        self._invalidate_active()
 
         self._audit("pattern_activated", {
             "pattern_id": pattern_id,
@@ -312,8 +383,10 @@ class LearningRing:
         Report a false positive for a learned pattern.
         If FP rate exceeds the limit, auto-deactivate.
         """
+        self.flush_evaluations()
         with self._lock:
             with self._get_conn() as conn:
+                conn.execute("BEGIN IMMEDIATE")
                 row = conn.execute(
                     "SELECT false_positives, total_evaluations, status FROM learned_patterns WHERE pattern_id = ?",
                     (pattern_id,),
@@ -339,6 +412,7 @@ class LearningRing:
                         (now, pattern_id),
                     )
                     conn.commit()
+                    self._invalidate_active()
 
                     self._audit("pattern_deactivated", {
                         "pattern_id": pattern_id,
@@ -356,20 +430,49 @@ class LearningRing:
                 conn.commit()
                 return {"action": "recorded", "false_positives": fps}
 
+    # Buffered evaluations that trigger a write without waiting for a reader
+    _EVAL_FLUSH_THRESHOLD = 256
+
     def record_evaluation(self, pattern_id: str) -> None:
-        """Increment evaluation count for a pattern (for FP rate calculation)."""
+        """Increment evaluation count for a pattern (for FP rate calculation).
+
+        Counts are buffered and written in one transaction by
+        flush_evaluations(), which runs before anything reads them back
+        and once the buffer reaches _EVAL_FLUSH_THRESHOLD.
+        """
+        with self._buffer_lock:
+            self._eval_buffer[pattern_id] += 1
+            self._eval_pending += 1
+            full = self._eval_pending >= self._EVAL_FLUSH_THRESHOLD
+        if full:
+            self.flush_evaluations()
+
+    def flush_evaluations(self) -> None:
+        """Write buffered evaluation counts to SQLite in a single transaction."""
+        with self._buffer_lock:
+            if not self._eval_buffer:
+                return
+            counts, self._eval_buffer = self._eval_buffer, Counter()
+            self._eval_pending = 0
         with self._get_conn() as conn:
-            conn.execute(
-                "UPDATE learned_patterns SET total_evaluations = total_evaluations + 1 WHERE pattern_id = ?",
-                (pattern_id,),
+            conn.executemany(
+                "UPDATE learned_patterns SET total_evaluations = total_evaluations + ? WHERE pattern_id = ?",
+                [(n, pattern_id) for pattern_id, n in counts.items()],
             )
-            conn.commit()
 
-    def get_active_patterns(self) -> list[StructuralPattern]:
+    def get_active_patterns(self) -> tuple[StructuralPattern, ...]:
         """
         Return all active learned patterns as StructuralPattern objects,
         compatible with the frozen core's evaluation engine.
+
+        Served from an immutable snapshot; SQLite is only queried after
+        an activation or deactivation has invalidated it.
         """
+        snapshot = self._active_snapshot
+        if snapshot is not None:
+            return snapshot
+
+        version = self._version
         with self._get_conn() as conn:
             rows = conn.execute(
                 """SELECT pattern_id, name, description, pit_tier, severity,
@@ -377,7 +480,7 @@ class LearningRing:
                    FROM learned_patterns WHERE status = 'active'"""
             ).fetchall()
 
-        return [
+        snapshot = tuple(
             StructuralPattern(
                 id=row[0],
                 name=row[1],
@@ -389,12 +492,41 @@ class LearningRing:
                 min_matches=1,
             )
             for row in rows
-        ]
+        )
+        # Don't publish a snapshot that raced with a status change
+        if version == self._version:
+            self._active_snapshot = snapshot
+        return snapshot
+
+    def get_status_counts(self) -> dict[str, int]:
+        """Return pattern counts by status ("active", "staging", "deactivated").
+
+        Cached between status transitions, so health checks don't
+        materialize every pattern just to count them.
+        """
+        counts = self._status_counts
+        if counts is not None:
+            return counts
+
+        epoch = self._status_epoch
+        with self._get_conn() as conn:
+            rows = conn.execute(
+                "SELECT status, COUNT(*) FROM learned_patterns GROUP BY status"
+            ).fetchall()
+        counts = {"active": 0, "staging": 0, "deactivated": 0, **dict(rows)}
+        # Don't publish counts that raced with a status change
+        if epoch == self._status_epoch:
+            self._status_counts = counts
+        return counts
 
     def get_all_patterns(self) -> list[dict]:
         """Return all learned patterns with full metadata."""
+        self.flush_evaluations()
         with self._get_conn() as conn:
-            rows = conn.execute(
+            # Row objects only for this cursor; keys follow the SELECT order
+            cur = conn.cursor()
+            cur.row_factory = sqlite3.Row
+            rows = cur.execute(
                 """SELECT pattern_id, name, description, pit_tier, severity,
                           principle, regex, status, confirmations,
                           false_positives, total_evaluations,
@@ -402,17 +534,7 @@ class LearningRing:
                    FROM learned_patterns ORDER BY proposed_at DESC"""
             ).fetchall()
 
-        return [
-            {
-                "pattern_id": r[0], "name": r[1], "description": r[2],
-                "pit_tier": r[3], "severity": r[4], "principle": r[5],
-                "regex": r[6], "status": r[7], "confirmations": r[8],
-                "false_positives": r[9], "total_evaluations": r[10],
-                "proposed_at": r[11], "activated_at": r[12],
-                "deactivated_at": r[13],
-            }
-            for r in rows
-        ]
+        return [dict(r) for r in rows]
 
 
 def _get_learning_ring() -> LearningRing:
@@ -425,4 +547,16 @@ def _get_learning_ring() -> LearningRing:
     )
 
 
-learning_ring = _get_learning_ring()
+_singleton_lock = threading.Lock()
+
+
+def __getattr__(name: str):
+    # learning_ring is built on first access, so importing this module
+    # doesn't open SQLite or read the JSON export
+    if name != "learning_ring":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    with _singleton_lock:
+        ring = globals().get("learning_ring")
+        if ring is None:
+            ring = globals()["learning_ring"] = _get_learning_ring()
+    return ring
@@ -112,9 +112,11 @@ class PatternProposer:
 
         # Determine what deep found that local didn't
         local_pattern_ids = set(f.get("pattern_id", "") for f in local_flags)
-        deep_bias_types = set(
+        # Ordered dedup: these are joined into the LLM prompt, so a set's
+        # per-process hash order would make identical scans differ
+        deep_bias_types = list(dict.fromkeys(
             b for b in deep_result.get("bias_types", []) if b != "none"
-        )
+        ))
 
         # If local already caught substantial bias, the gap is smaller
         if len(local_flags) >= 3:
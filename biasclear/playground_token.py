@@ -20,13 +20,14 @@ from __future__ import annotations
 import base64
 import hashlib
 import hmac
-import json
 import os
 import secrets
 import threading
 import time
 from typing import Optional
 
+import orjson
+
 
 # Server-side secret — auto-generated if not set in env
 _PLAYGROUND_SECRET = os.getenv(
@@ -100,12 +101,12 @@ def create_playground_token(ip: str) -> Optional[str]:
     nonce = secrets.token_hex(8)
     ip_hash = _hash_ip(ip)
 
-    payload = json.dumps({
+    payload = orjson.dumps({
         "iat": int(now),
         "exp": int(now + TOKEN_TTL_SECONDS),
         "ip": ip_hash,
         "nonce": nonce,
-    }, separators=(",", ":"))
+    }).decode()
 
     signature = _sign(payload)
     token_id = hashlib.sha256(f"{nonce}{now}".encode()).hexdigest()[:16]
@@ -142,7 +143,7 @@ def validate_playground_token(token: str, ip: str) -> tuple[bool, str]:
     try:
         payload_bytes = base64.urlsafe_b64decode(encoded_payload)
         payload_str = payload_bytes.decode()
-        payload = json.loads(payload_str)
+        payload = orjson.loads(payload_str)
     except Exception:
         return False, "decode_error"
 
@@ -1,8 +1,16 @@
 """
 Rate Limiter — Per-Key Request Throttling
 
-Simple sliding window rate limiter backed by an in-memory dict.
-Phase 4 (enterprise) replaces this with Redis-backed limiting.
+Token-bucket rate limiter backed by an in-memory dict. Each key holds
+two lazily refilled buckets: a per-minute bucket (burst capacity) and a
+per-hour bucket (sustained budget). A check costs one monotonic clock
+read and a handful of float ops — no timestamp lists to scan or trim.
+Keys are spread over lock-striped shards so concurrent requests for
+different keys rarely contend on the same lock.
+
+When BIASCLEAR_REDIS_URL is set, enforce_rate_limit() checks shared
+Redis windows instead (see rate_limit_redis.py), so the limit holds
+across workers; the in-memory buckets remain the fallback.
 
 Limits are configurable per-tier:
   - Free tier: 20 requests/minute, 200/hour
@@ -12,6 +20,8 @@ Limits are configurable per-tier:
 
 from __future__ import annotations
 
+import logging
+import math
 import os
 import time
 import threading
@@ -21,28 +31,13 @@ from typing import Optional
 
 from fastapi import HTTPException
 
+logger = logging.getLogger("biasclear.rate_limit")
 
 # Maximum number of unique keys tracked before LRU eviction
 MAX_RATE_LIMIT_KEYS = 5000
 
-
-@dataclass
-class RateWindow:
-    """Sliding window counter."""
-    timestamps: list[float] = field(default_factory=list)
-
-    def count_within(self, window_seconds: float) -> int:
-        """Count requests within the sliding window (non-mutating)."""
-        cutoff = time.time() - window_seconds
-        return sum(1 for t in self.timestamps if t > cutoff)
-
-    def record(self):
-        """Record a new request and trim stale entries."""
-        now = time.time()
-        self.timestamps.append(now)
-        # Trim entries older than max window (1 hour) to bound memory
-        if len(self.timestamps) > 100:
-            self.timestamps = [t for t in self.timestamps if t > now - 3600]
+# Lock stripes — a power of two so shard selection is a mask
+_SHARD_COUNT = 16
 
 
 @dataclass
@@ -64,10 +59,56 @@ PLAYGROUND_LIMITS = RateLimits(
     per_hour=int(os.getenv("BIASCLEAR_PLAYGROUND_RATE_PER_HOUR", "100")),
 )
 
-# LRU-bounded store: key_hash → RateWindow
-# OrderedDict tracks access order for eviction
-_windows: OrderedDict[str, RateWindow] = OrderedDict()
-_lock = threading.Lock()
+
+@dataclass
+class TokenBucket:
+    """Minute and hour token buckets for one key, refilled on access."""
+    limits: RateLimits
+    minute_tokens: float
+    hour_tokens: float
+    last: float = field(default_factory=time.monotonic)
+
+    @classmethod
+    def full(cls, limits: RateLimits) -> "TokenBucket":
+        return cls(limits, float(limits.per_minute), float(limits.per_hour))
+
+    def refill(self, now: float) -> None:
+        """Credit tokens earned since the last access, capped at capacity."""
+        elapsed = now - self.last
+        self.last = now
+        self.minute_tokens = min(
+            self.limits.per_minute,
+            self.minute_tokens + elapsed * self.limits.per_minute / 60,
+        )
+        self.hour_tokens = min(
+            self.limits.per_hour,
+            self.hour_tokens + elapsed * self.limits.per_hour / 3600,
+        )
+
+
+class _Shard:
+    """One lock stripe: an LRU-bounded key_hash → TokenBucket map."""
+    __slots__ = ("lock", "buckets")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # OrderedDict tracks access order for eviction
+        self.buckets: OrderedDict[str, TokenBucket] = OrderedDict()
+
+
+_shards = tuple(_Shard() for _ in range(_SHARD_COUNT))
+_SHARD_MAX_KEYS = MAX_RATE_LIMIT_KEYS // _SHARD_COUNT
+
+
+def _shard_for(key: str) -> _Shard:
+    return _shards[hash(key) & (_SHARD_COUNT - 1)]
+
+
+def _clear_buckets() -> None:
+    """Drop all tracked buckets (used by tests)."""
+    for shard in _shards:
+        with shard.lock:
+            shard.buckets.clear()
 
 # Whether rate limiting is active
 RATE_LIMIT_ENABLED = os.getenv("BIASCLEAR_RATE_LIMIT", "true").lower() == "true"
@@ -95,74 +136,135 @@ def check_rate_limit(
     Raises:
         HTTPException 429 if rate limit exceeded.
     """
-    if not RATE_LIMIT_ENABLED:
+    resolved = _resolve(key_id, limits, ip)
+    if resolved is not None:
+        _check_local(*resolved)
+
+
+async def enforce_rate_limit(
+    key_id: Optional[str],
+    limits: Optional[RateLimits] = None,
+    ip: Optional[str] = None,
+) -> None:
+    """
+    Async check_rate_limit() for request handlers.
+
+    Uses the shared Redis limiter when configured. If Redis is
+    unreachable, degrades to the per-process buckets rather than
+    failing the request.
+    """
+    resolved = _resolve(key_id, limits, ip)
+    if resolved is None:
+        return
+    key, limits = resolved
+
+    from biasclear.rate_limit_redis import get_redis_limiter
+    limiter = get_redis_limiter()
+    if limiter is None:
+        _check_local(key, limits)
         return
 
+    try:
+        window_ms, retry_ms = await limiter.hit(key, limits.per_minute, limits.per_hour)
+    except limiter.errors as e:
+        logger.warning("Redis rate limiter unavailable, using local buckets: %s", e)
+        _check_local(key, limits)
+        return
+
+    if window_ms:
+        retry = max(1, math.ceil(retry_ms / 1000))
+        limit = (
+            f"{limits.per_minute} requests/minute" if window_ms == 60_000
+            else f"{limits.per_hour} requests/hour"
+        )
+        raise HTTPException(
+            status_code=429,
+            detail=f"Rate limit exceeded: {limit}. Retry after {retry} seconds.",
+            headers={"Retry-After": str(retry)},
+        )
+
+
+def _resolve(
+    key_id: Optional[str],
+    limits: Optional[RateLimits],
+    ip: Optional[str],
+) -> Optional[tuple[str, RateLimits]]:
+    """Pick the limiting key and limits, or None when no limit applies."""
+    if not RATE_LIMIT_ENABLED:
+        return None
+
     # Unauthenticated requests: rate limit by IP with stricter playground limits
     if key_id is None:
         if ip:
             key_id = _hash_ip(ip)
             limits = limits or PLAYGROUND_LIMITS
         else:
-            return  # Dev mode — no IP, no limits
-
-    limits = limits or DEFAULT_LIMITS
-
-    with _lock:
-        if key_id not in _windows:
-            # Evict oldest entry if at capacity
-            if len(_windows) >= MAX_RATE_LIMIT_KEYS:
-                _windows.popitem(last=False)  # Remove least-recently-used
-            _windows[key_id] = RateWindow()
+            return None  # Dev mode — no IP, no limits
+
+    return key_id, limits or DEFAULT_LIMITS
+
+
+def _check_local(key_id: str, limits: RateLimits) -> None:
+    """Spend one request from the in-memory buckets, or raise 429."""
+    shard = _shard_for(key_id)
+    with shard.lock:
+        buckets = shard.buckets
+        bucket = buckets.get(key_id)
+        if bucket is None:
+            # Evict oldest entry if the shard is at capacity
+            if len(buckets) >= _SHARD_MAX_KEYS:
+                buckets.popitem(last=False)  # Remove least-recently-used
+            bucket = buckets[key_id] = TokenBucket.full(limits)
         else:
             # Move to end (most recently used)
-            _windows.move_to_end(key_id)
+            buckets.move_to_end(key_id)
+            bucket.limits = limits
 
-        window = _windows[key_id]
+        bucket.refill(time.monotonic())
 
-        # Check per-minute
-        minute_count = window.count_within(60)
-        if minute_count >= limits.per_minute:
+        # Check per-minute burst
+        if bucket.minute_tokens < 1:
+            retry = math.ceil((1 - bucket.minute_tokens) * 60 / limits.per_minute)
             raise HTTPException(
                 status_code=429,
                 detail=f"Rate limit exceeded: {limits.per_minute} requests/minute. "
-                       f"Retry after {60 - int(time.time() % 60)} seconds.",
-                headers={"Retry-After": str(60 - int(time.time() % 60))},
+                       f"Retry after {retry} seconds.",
+                headers={"Retry-After": str(retry)},
             )
 
-        # Check per-hour
-        hour_count = window.count_within(3600)
-        if hour_count >= limits.per_hour:
+        # Check per-hour budget
+        if bucket.hour_tokens < 1:
+            retry = math.ceil((1 - bucket.hour_tokens) * 3600 / limits.per_hour)
             raise HTTPException(
                 status_code=429,
                 detail=f"Rate limit exceeded: {limits.per_hour} requests/hour.",
-                headers={"Retry-After": "3600"},
+                headers={"Retry-After": str(retry)},
             )
 
-        # Record the request
-        window.record()
+        # Spend the request
+        bucket.minute_tokens -= 1
+        bucket.hour_tokens -= 1
 
 
 def get_usage(key_id: str) -> dict:
-    """Get current usage stats for a key."""
-    with _lock:
-        window = _windows.get(key_id)
-        if not window:
+    """Get current usage (tokens spent and not yet refilled) for a key."""
+    shard = _shard_for(key_id)
+    with shard.lock:
+        bucket = shard.buckets.get(key_id)
+        if not bucket:
             return {"minute": 0, "hour": 0}
+        bucket.refill(time.monotonic())
         return {
-            "minute": window.count_within(60),
-            "hour": window.count_within(3600),
+            "minute": round(bucket.limits.per_minute - bucket.minute_tokens),
+            "hour": round(bucket.limits.per_hour - bucket.hour_tokens),
         }
 
 
-def cleanup_stale_windows(max_age: float = 7200):
-    """Remove windows with no recent activity. Call periodically."""
-    cutoff = time.time() - max_age
-    with _lock:
-        stale = [
-            k for k, w in _windows.items()
-            if not w.timestamps or w.timestamps[-1] < cutoff
-        ]
-        for k in stale:
-            del _windows[k]
-
+def cleanup_stale_buckets(max_age: float = 7200):
+    """Remove buckets with no recent activity. Call periodically."""
+    cutoff = time.monotonic() - max_age
+    for shard in _shards:
+        with shard.lock:
+            stale = [k for k, b in shard.buckets.items() if b.last < cutoff]
+            for k in stale:
+                del shard.buckets[k]
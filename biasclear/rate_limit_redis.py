@@ -0,0 +1,111 @@
+"""
+Redis Rate Limiter — Shared Rolling Windows Across Workers
+
+The in-memory token buckets in rate_limit.py are per-process: with N
+uvicorn/gunicorn workers a client gets N times its budget. When
+BIASCLEAR_REDIS_URL is set, limits are enforced in Redis instead.
+
+Each key owns two sorted sets (minute and hour windows) scored by
+request time in ms. One Lua script trims expired members, checks both
+windows, and records the request only if both have room — so the
+check-and-increment is atomic across every worker. Both keys share a
+{hash tag}, so the script also runs on Redis Cluster.
+
+This only makes rate limits global. The audit chain has a single head:
+workers sharing one BIASCLEAR_AUDIT_DB stay correctly chained, but a
+hash returned before commit can be superseded by another worker's
+write (see biasclear/audit.py).
+
+Requires the optional `redis` package (pip install biasclear[redis]).
+"""
+
+from __future__ import annotations
+
+import logging
+import secrets
+import time
+from typing import Optional
+
+logger = logging.getLogger("biasclear.rate_limit")
+
+# KEYS: minute zset, hour zset
+# ARGV: now_ms, per_minute, per_hour, member
+# Returns {0, 0} if allowed, else {window_ms, retry_after_ms}.
+_ROLLING_WINDOW_LUA = """
+local now = tonumber(ARGV[1])
+local windows = {
+    {KEYS[1], 60000, tonumber(ARGV[2])},
+    {KEYS[2], 3600000, tonumber(ARGV[3])},
+}
+for _, w in ipairs(windows) do
+    redis.call('ZREMRANGEBYSCORE', w[1], 0, now - w[2])
+    if redis.call('ZCARD', w[1]) >= w[3] then
+        local oldest = redis.call('ZRANGE', w[1], 0, 0, 'WITHSCORES')
+        return {w[2], tonumber(oldest[2]) + w[2] - now}
+    end
+end
+for _, w in ipairs(windows) do
+    redis.call('ZADD', w[1], now, ARGV[4])
+    redis.call('PEXPIRE', w[1], w[2])
+end
+return {0, 0}
+"""
+
+
+class RedisRateLimiter:
+    """Atomic minute/hour rolling-window limiter backed by Redis."""
+
+    def __init__(self, url: str):
+        import redis.asyncio as redis_asyncio
+        from redis.exceptions import RedisError
+
+        self._client = redis_asyncio.Redis.from_url(url)
+        # Script objects call EVALSHA and reload on NOSCRIPT automatically
+        self._script = self._client.register_script(_ROLLING_WINDOW_LUA)
+        self.errors: tuple[type[BaseException], ...] = (RedisError, OSError)
+
+    async def hit(self, key: str, per_minute: int, per_hour: int) -> tuple[int, int]:
+        """Record one request for key if both windows allow it.
+
+        Returns (0, 0) when allowed, else (window_ms, retry_after_ms) for
+        the window that is full.
+        """
+        now_ms = int(time.time() * 1000)
+        window_ms, retry_ms = await self._script(
+            keys=[f"biasclear:rl:{{{key}}}:m", f"biasclear:rl:{{{key}}}:h"],
+            args=[now_ms, per_minute, per_hour, f"{now_ms}-{secrets.token_hex(6)}"],
+        )
+        return int(window_ms), int(retry_ms)
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+_limiter: Optional[RedisRateLimiter] = None
+_limiter_loaded = False
+
+
+def get_redis_limiter() -> Optional[RedisRateLimiter]:
+    """Return the shared limiter, or None when Redis isn't configured."""
+    global _limiter, _limiter_loaded
+    if not _limiter_loaded:
+        _limiter_loaded = True
+        from biasclear.config import settings
+        if settings.REDIS_URL:
+            try:
+                _limiter = RedisRateLimiter(settings.REDIS_URL)
+                logger.info("Rate limiting via Redis")
+            except ImportError:
+                logger.warning(
+                    "BIASCLEAR_REDIS_URL is set but the redis package is not "
+                    "installed — falling back to per-process rate limiting."
+                )
+    return _limiter
+
+
+async def close_redis_limiter() -> None:
+    """Close the shared Redis client (call on shutdown)."""
+    global _limiter, _limiter_loaded
+    if _limiter is not None:
+        await _limiter.close()
+    _limiter, _limiter_loaded = None, False
@@ -135,6 +135,11 @@ class ChainVerification(BaseModel):
     verified: bool
     entries_checked: int
     broken_links: list[dict]
+    # False when the window didn't reach genesis, so truncation and
+    # re-chaining were not checked
+    merkle_checked: bool = False
+    merkle_root: Optional[str] = None
+    merkle_size: Optional[int] = None
 
 
 # ============================================================
@@ -14,8 +14,34 @@ Score = 100 minus weighted penalties from:
 
 from __future__ import annotations
 
+import functools
+
 from biasclear.frozen_core import CoreEvaluation
 
+# Penalty tables, shared by every call
+_STRUCTURAL_PENALTY = {"critical": 25, "high": 20, "moderate": 14, "low": 8}
+_TIER_PENALTY = {1: 10, 2: 7, 3: 4}
+_AI_PENALTY = {"critical": 14, "high": 10, "moderate": 6, "low": 3}
+_DEEP_SEVERITY_PENALTY = {"critical": 20, "high": 15, "moderate": 8, "low": 4, "none": 0}
+
+# Cap total AI-layer penalty to reduce variance from LLM non-determinism.
+# When the deterministic core already flags heavily, AI additions should
+# not create large score gaps for structurally identical inputs.
+_MAX_AI_PENALTY = 30
+_MAX_DEEP_PENALTY = 30
+
+
+@functools.cache
+def _tier_penalty(pit_tier_active: str) -> int:
+    """Penalty for a dominant tier label like "tier_1_ideological".
+
+    Only a handful of labels exist, so each is parsed once.
+    """
+    try:
+        return _TIER_PENALTY.get(int(pit_tier_active.split("_")[1]), 0)
+    except (IndexError, ValueError):
+        return 0
+
 
 def calculate_truth_score(
     core_eval: CoreEvaluation,
@@ -54,20 +80,22 @@ def calculate_truth_score(
 
     # --- Local penalties ---
     tier_set: set[int] = set()
-    structural_penalty = {"critical": 25, "high": 20, "moderate": 14, "low": 8}
+    structural_penalties = breakdown["core_structural_penalties"]
     marker_count = 0
 
     for flag in core_eval.flags:
-        if flag.category == "structural":
-            pen = structural_penalty.get(flag.severity, 8)
+        category = flag.category
+        if category == "structural":
+            severity = flag.severity
+            pen = _STRUCTURAL_PENALTY.get(severity, 8)
             score -= pen
             tier_set.add(flag.pit_tier)
-            breakdown["core_structural_penalties"].append({
+            structural_penalties.append({
                 "pattern": flag.pattern_id,
-                "severity": flag.severity,
+                "severity": severity,
                 "penalty": -pen,
             })
-        elif flag.category == "marker":
+        elif category == "marker":
             score -= 4
             marker_count += 1
 
@@ -75,14 +103,9 @@ def calculate_truth_score(
 
     # PIT tier penalty (from dominant tier)
     if core_eval.pit_tier_active:
-        try:
-            tier_num = int(core_eval.pit_tier_active.split("_")[1])
-            tier_penalty = {1: 10, 2: 7, 3: 4}
-            pen = tier_penalty.get(tier_num, 0)
-            score -= pen
-            breakdown["pit_tier_penalty"] = -pen
-        except (IndexError, ValueError):
-            pass
+        pen = _tier_penalty(core_eval.pit_tier_active)
+        score -= pen
+        breakdown["pit_tier_penalty"] = -pen
 
     # Multi-tier diversity penalty: distortions spanning multiple PIT tiers
     # indicates a more sophisticated or embedded bias pattern
@@ -92,15 +115,10 @@ def calculate_truth_score(
         breakdown["multi_tier_penalty"] = -pen
 
     # --- AI flag penalties (lighter than core — non-deterministic) ---
-    # Cap total AI-layer penalty to reduce variance from LLM non-determinism.
-    # When the deterministic core already flags heavily, AI additions should
-    # not create large score gaps for structurally identical inputs.
-    _MAX_AI_PENALTY = 30
-    ai_penalty_map = {"critical": 14, "high": 10, "moderate": 6, "low": 3}
     ai_total = 0
     for af in ai_flags:
         sev = af.get("severity", "moderate")
-        pen = ai_penalty_map.get(sev, 6)
+        pen = _AI_PENALTY.get(sev, 6)
         ai_total += pen
         breakdown["ai_flag_penalties"].append({
             "pattern": af.get("pattern_id", "unknown"),
@@ -111,13 +129,9 @@ def calculate_truth_score(
     score -= ai_total
 
     # --- Deep analysis penalties (when available) ---
-    _MAX_DEEP_PENALTY = 30
     if deep_result:
         severity = deep_result.get("severity", "none")
-        deep_sev_penalty = {
-            "critical": 20, "high": 15, "moderate": 8, "low": 4, "none": 0,
-        }
-        pen = deep_sev_penalty.get(severity, 0)
+        pen = _DEEP_SEVERITY_PENALTY.get(severity, 0)
         breakdown["deep_severity_penalty"] = -pen
 
         bias_types = deep_result.get("bias_types", [])
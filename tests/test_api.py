@@ -31,12 +31,10 @@ def client():
 @pytest.fixture(autouse=True)
 def reset_rate_limits():
     """Keep API tests independent of previous request volume."""
-    from biasclear.rate_limit import _windows, _lock
-    with _lock:
-        _windows.clear()
+    from biasclear.rate_limit import _clear_buckets
+    _clear_buckets()
     yield
-    with _lock:
-        _windows.clear()
+    _clear_buckets()
 
 
 # ============================================================
@@ -59,6 +57,11 @@ class TestHealth:
         assert "audit_entries" in data
         assert "learning_enabled" in data
 
+    def test_liveness_probe_is_static(self, client):
+        r = client.get("/health/live")
+        assert r.status_code == 200
+        assert r.json() == {"status": "operational", "version": "1.2.0"}
+
     def test_version_header_matches_health(self, client):
         res = client.get("/health")
         assert res.headers["x-biasclear-version"] == res.json()["version"]
@@ -190,6 +193,60 @@ class TestScanLocal:
         data = r.json()
         assert "score_breakdown" in data
 
+    def test_cache_hit_returns_identical_body(self, client):
+        from biasclear.cache import scan_cache
+        payload = {
+            "text": "Cache probe: everyone knows this is obviously true.",
+            "mode": "local",
+            "domain": "general",
+        }
+        first = client.post("/scan", json=payload)
+        hits = scan_cache.stats["hits"]
+        second = client.post("/scan", json=payload)
+        assert scan_cache.stats["hits"] == hits + 1
+        assert second.status_code == 200
+        assert second.headers["content-type"] == "application/json"
+        assert second.json() == first.json()
+
+    def test_scan_cache_admits_repeats_and_evicts_least_recently_used(self):
+        import asyncio
+        from biasclear.cache import ScanCache
+
+        async def scan(cache, text):
+            # The API's flow: look up, and store the result on a miss
+            if await cache.get(text, "general", "local") is None:
+                await cache.put(text, "general", "local", text.upper())
+
+        async def run():
+            cache = ScanCache(max_entries=2)
+            for text in "aba":
+                await scan(cache, text)
+            await scan(cache, "c")  # one-off: refused, b stays
+            assert cache._cache.keys() == {cache._make_key(t, "general", "local", "") for t in "ab"}
+            await scan(cache, "c")  # repeat: admitted over LRU b
+            return [await cache.get(t, "general", "local") for t in "abc"]
+
+        assert asyncio.run(run()) == ["A", None, "C"]
+
+    def test_scan_cache_replaces_expired_victim_regardless_of_frequency(self):
+        import asyncio
+        from unittest.mock import patch
+        from biasclear.cache import ScanCache
+
+        async def run():
+            cache = ScanCache(ttl_seconds=10, max_entries=1)
+            with patch("biasclear.cache.time.monotonic", return_value=0.0):
+                for _ in range(3):  # a is popular...
+                    await cache.get("a", "general", "local")
+                await cache.put("a", "general", "local", "A")
+            with patch("biasclear.cache.time.monotonic", return_value=60.0):
+                # ...but expired, so a one-off b still takes its slot
+                assert await cache.get("b", "general", "local") is None
+                await cache.put("b", "general", "local", "B")
+                return await cache.get("b", "general", "local")
+
+        assert asyncio.run(run()) == "B"
+
 
 # ============================================================
 # SCAN BATCH — LOCAL MODE
@@ -210,6 +267,117 @@ class TestScanBatch:
         assert data["scanned"] == 2
         assert len(data["results"]) == 2
 
+    def test_batch_duplicates_scanned_once(self, client):
+        from unittest.mock import patch
+        import api.main as main_mod
+
+        item = {"text": "All experts agree this is true.", "mode": "local", "domain": "general"}
+        with patch.object(main_mod, "scan_local", wraps=main_mod.scan_local) as spy:
+            r = client.post("/scan/batch", json={
+                "items": [item, {**item, "text": "Clean factual statement."}, item, item],
+            })
+        assert r.status_code == 200
+        data = r.json()
+        assert spy.call_count == 2
+        assert data["total"] == 4
+        assert data["scanned"] == 4
+        assert data["results"][0] == data["results"][2] == data["results"][3]
+        assert data["results"][1]["text"] == "Clean factual statement."
+
+    def test_batch_keeps_input_order_when_items_finish_out_of_order(self, client):
+        from unittest.mock import patch
+        import asyncio
+        import api.main as main_mod
+
+        real_scan_local = main_mod.scan_local
+
+        async def slow_first(text, **kwargs):
+            if text.startswith("Slow"):
+                await asyncio.sleep(0.05)
+            return await real_scan_local(text, **kwargs)
+
+        with patch.object(main_mod, "scan_local", side_effect=slow_first):
+            r = client.post("/scan/batch", json={"items": [
+                {"text": "Slow item first.", "mode": "local", "domain": "general"},
+                {"text": "Fast item second.", "mode": "local", "domain": "general"},
+            ]})
+        assert r.status_code == 200
+        texts = [res["text"] for res in r.json()["results"]]
+        assert texts == ["Slow item first.", "Fast item second."]
+
+    def test_batch_failed_items_get_error_placeholder(self, client):
+        from unittest.mock import patch
+        import api.main as main_mod
+
+        real_scan_local = main_mod.scan_local
+
+        async def fail_some(text, **kwargs):
+            if text.startswith("Broken"):
+                raise RuntimeError("boom")
+            return await real_scan_local(text, **kwargs)
+
+        with patch.object(main_mod, "scan_local", side_effect=fail_some):
+            r = client.post("/scan/batch", json={"items": [
+                {"text": "Broken one.", "mode": "local", "domain": "general"},
+                {"text": "Fine item.", "mode": "local", "domain": "general"},
+                {"text": "Broken two.", "mode": "local", "domain": "general"},
+            ]})
+        assert r.status_code == 200
+        data = r.json()
+        assert data["scanned"] == 1
+        assert data["results"][0] == data["results"][2]
+        assert data["results"][0]["scan_mode"] == "error"
+        assert data["results"][0]["flags"] == []
+
+    def test_batch_reads_learned_patterns_once(self, client):
+        from unittest.mock import AsyncMock, patch
+        import api.main as main_mod
+
+        real_scan_local = main_mod.scan_local
+
+        async def as_local(text, domain="general", external_patterns=None, **kwargs):
+            return await real_scan_local(text, domain=domain)
+
+        snapshot = [{"id": "LEARNED_TEST"}]
+        with patch.object(main_mod.learning_ring, "get_active_patterns", return_value=snapshot) as ring, \
+                patch.object(main_mod, "scan_local", new=AsyncMock(side_effect=as_local)) as local, \
+                patch.object(main_mod, "scan_deep", new=AsyncMock(side_effect=as_local)) as deep, \
+                patch.object(main_mod, "scan_full", new=AsyncMock(side_effect=as_local)) as full:
+            r = client.post("/scan/batch", json={"items": [
+                {"text": "Local item.", "mode": "local", "domain": "general"},
+                {"text": "Deep item.", "mode": "deep", "domain": "general"},
+                {"text": "Full item.", "mode": "full", "domain": "general"},
+            ]})
+        assert r.status_code == 200
+        assert ring.call_count == 1
+        for spy in (local, deep, full):
+            assert spy.await_args.kwargs["external_patterns"] is snapshot
+
+    def test_batch_stream_emits_ndjson_in_completion_order(self, client):
+        from unittest.mock import patch
+        import asyncio
+        import json
+        import api.main as main_mod
+
+        real_scan_local = main_mod.scan_local
+
+        async def slow_first(text, **kwargs):
+            if text.startswith("Slow"):
+                await asyncio.sleep(0.05)
+            return await real_scan_local(text, **kwargs)
+
+        fast = {"text": "Fast item.", "mode": "local", "domain": "general"}
+        with patch.object(main_mod, "scan_local", side_effect=slow_first):
+            r = client.post("/scan/batch/stream", json={"items": [
+                {"text": "Slow item.", "mode": "local", "domain": "general"}, fast, fast,
+            ]})
+        assert r.status_code == 200
+        assert r.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in r.text.splitlines()]
+        assert [line["index"] for line in lines] == [1, 2, 0]
+        assert lines[0]["result"] == lines[1]["result"]
+        assert lines[2]["result"]["text"] == "Slow item."
+
     def test_batch_empty_rejected(self, client):
         r = client.post("/scan/batch", json={"items": []})
         assert r.status_code == 422
@@ -304,6 +472,7 @@ class TestPatterns:
         data = r.json()
         assert data["frozen_patterns"] > 0
         assert "patterns" in data
+        assert r.headers["cache-control"] == "private, max-age=5"
 
     def test_patterns_legal(self, client):
         r = client.get("/patterns?domain=legal")
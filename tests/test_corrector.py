@@ -283,6 +283,23 @@ class TestDiffSpans:
         spans = _compute_diff_spans("", "")
         assert spans == []
 
+    @pytest.mark.parametrize("original, corrected", [
+        ("hello world", "hello world, today"),
+        ("hello world, today", "hello world"),
+        ("world", "hello world"),
+        ("hello world", "world"),
+        ("bbb   ", "bbbb   "),
+        ("", "new text"),
+        ("old text", ""),
+    ])
+    def test_trivial_edits_match_full_diff(self, original, corrected):
+        from biasclear.corrector import _dmp
+        diffs = _dmp.diff_main(original, corrected)
+        _dmp.diff_cleanupSemantic(diffs)
+        op = {"equal": 0, "delete": -1, "insert": 1}
+        spans = _compute_diff_spans(original, corrected)
+        assert [(op[s["type"]], s["text"]) for s in spans] == [tuple(d) for d in diffs]
+
 
 # ============================================================
 # PATTERN LOOKUP
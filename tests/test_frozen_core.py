@@ -16,6 +16,12 @@ class TestCoreVersion:
         result = frozen_core.evaluate("Hello world")
         assert result.core_version == CORE_VERSION
 
+    def test_patterns_are_immutable(self):
+        import dataclasses
+        from biasclear.frozen_core import STRUCTURAL_PATTERNS
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            STRUCTURAL_PATTERNS[0].severity = "low"
+
 
 class TestCleanText:
     """Text with no bias should pass clean."""
@@ -997,3 +1003,14 @@ class TestCausalBlameSymmetry:
         pids = {f.pattern_id for f in result.flags if f.category == "structural"}
         assert "CAUSAL_TOTALIZATION" not in pids, f"False positive: {text}"
         assert "MONOCAUSAL_BLAME" not in pids, f"False positive: {text}"
+
+
+class TestSummary:
+    def test_structural_names_in_first_seen_order(self):
+        result = frozen_core.evaluate(
+            "All experts agree on this. Studies show it works. "
+            "You're either with us or against us. Everyone agrees."
+        )
+        ids = [f.pattern_id for f in result.flags if f.category == "structural"]
+        assert len(set(ids)) >= 2
+        assert ", ".join(dict.fromkeys(ids)) in result.summary
@@ -46,28 +46,29 @@ class TestRateLimiter:
     """Rate limiting tests."""
 
     def test_under_limit_passes(self):
-        from biasclear.rate_limit import check_rate_limit, RateLimits, _windows, _lock
+        from biasclear.rate_limit import check_rate_limit, RateLimits, _shard_for
 
-        with _lock:
-            _windows.pop("test_under", None)
+        shard = _shard_for("test_under")
+        with shard.lock:
+            shard.buckets.pop("test_under", None)
 
         # Should not raise
         check_rate_limit("test_under", RateLimits(per_minute=10, per_hour=100))
 
     def test_over_minute_limit_raises(self):
-        from biasclear.rate_limit import check_rate_limit, RateLimits, RateWindow, _windows, _lock
+        from biasclear.rate_limit import check_rate_limit, RateLimits, TokenBucket, _shard_for
         from fastapi import HTTPException
 
-        # Pre-fill the window
-        with _lock:
-            window = RateWindow()
-            now = time.time()
-            window.timestamps = [now - i for i in range(10)]  # 10 recent requests
-            _windows["test_minute"] = window
+        # Drain the minute bucket
+        limits = RateLimits(per_minute=10, per_hour=1000)
+        shard = _shard_for("test_minute")
+        with shard.lock:
+            shard.buckets["test_minute"] = TokenBucket(limits, minute_tokens=0.0, hour_tokens=990.0)
 
         with pytest.raises(HTTPException) as exc_info:
-            check_rate_limit("test_minute", RateLimits(per_minute=10, per_hour=1000))
+            check_rate_limit("test_minute", limits)
         assert exc_info.value.status_code == 429
+        assert 1 <= int(exc_info.value.headers["Retry-After"]) <= 6
 
     def test_none_key_skips(self):
         from biasclear.rate_limit import check_rate_limit
@@ -75,10 +76,11 @@ class TestRateLimiter:
         check_rate_limit(None)
 
     def test_get_usage(self):
-        from biasclear.rate_limit import get_usage, check_rate_limit, RateLimits, _windows, _lock
+        from biasclear.rate_limit import get_usage, check_rate_limit, RateLimits, _shard_for
 
-        with _lock:
-            _windows.pop("test_usage", None)
+        shard = _shard_for("test_usage")
+        with shard.lock:
+            shard.buckets.pop("test_usage", None)
 
         check_rate_limit("test_usage", RateLimits(per_minute=100, per_hour=1000))
         usage = get_usage("test_usage")
@@ -86,17 +88,141 @@ class TestRateLimiter:
         assert usage["hour"] == 1
 
     def test_cleanup_stale(self):
-        from biasclear.rate_limit import cleanup_stale_windows, RateWindow, _windows, _lock
+        from biasclear.rate_limit import cleanup_stale_buckets, TokenBucket, RateLimits, _shard_for
 
-        with _lock:
-            stale_window = RateWindow()
-            stale_window.timestamps = [time.time() - 10000]  # Very old
-            _windows["stale_key"] = stale_window
+        shard = _shard_for("stale_key")
+        with shard.lock:
+            stale_bucket = TokenBucket.full(RateLimits())
+            stale_bucket.last = time.monotonic() - 10000  # Very old
+            shard.buckets["stale_key"] = stale_bucket
 
-        cleanup_stale_windows(max_age=100)
+        cleanup_stale_buckets(max_age=100)
 
-        with _lock:
-            assert "stale_key" not in _windows
+        with shard.lock:
+            assert "stale_key" not in shard.buckets
+
+    def test_redis_verdict_maps_to_429(self):
+        import asyncio
+        from biasclear.rate_limit import enforce_rate_limit, RateLimits
+        from fastapi import HTTPException
+
+        class FullHourWindow:
+            errors = (OSError,)
+
+            async def hit(self, key, per_minute, per_hour):
+                return 3_600_000, 1500
+
+        with patch("biasclear.rate_limit_redis.get_redis_limiter", return_value=FullHourWindow()):
+            with pytest.raises(HTTPException) as exc_info:
+                asyncio.run(enforce_rate_limit("redis_key", RateLimits(per_minute=5, per_hour=50)))
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.headers["Retry-After"] == "2"
+        assert "50 requests/hour" in exc_info.value.detail
+
+    def test_redis_outage_falls_back_to_local_buckets(self):
+        import asyncio
+        from biasclear.rate_limit import enforce_rate_limit, get_usage, RateLimits, _shard_for
+
+        class Unreachable:
+            errors = (OSError,)
+
+            async def hit(self, key, per_minute, per_hour):
+                raise ConnectionRefusedError("redis down")
+
+        shard = _shard_for("redis_down_key")
+        with shard.lock:
+            shard.buckets.pop("redis_down_key", None)
+        with patch("biasclear.rate_limit_redis.get_redis_limiter", return_value=Unreachable()):
+            asyncio.run(enforce_rate_limit("redis_down_key", RateLimits(per_minute=5, per_hour=50)))
+        assert get_usage("redis_down_key")["minute"] == 1
+
+    def test_llm_pacer_spaces_requests_past_burst(self):
+        import asyncio
+        from unittest.mock import AsyncMock
+        from biasclear.llm import RequestPacer
+
+        pacer = RequestPacer(per_minute=120)  # 2/s burst, then one per 0.5s
+        sleep = AsyncMock()
+        with patch("biasclear.llm.time.monotonic", return_value=100.0), \
+                patch("biasclear.llm.asyncio.sleep", sleep):
+            for _ in range(4):
+                asyncio.run(pacer.wait())
+        assert [c.args[0] for c in sleep.await_args_list] == [0.5, 1.0]
+
+
+class TestLLMProvider:
+    """Provider-agnostic helpers on the LLMProvider base class."""
+
+    @pytest.mark.parametrize("raw", [
+        '{"ok": true}',
+        '```json\n{"ok": true}\n```',
+        '  ```\n{"ok": true}```\n',
+        '```json\n{"ok": true}',
+    ])
+    def test_generate_json_strips_fences(self, raw):
+        import asyncio
+        from biasclear.llm import LLMProvider
+
+        class Canned(LLMProvider):
+            async def generate(self, prompt, system_instruction=None,
+                               temperature=0.7, json_mode=False):
+                return raw
+
+        assert asyncio.run(Canned().generate_json("p")) == {"ok": True}
+
+    def test_providers_and_gemini_client_are_shared(self):
+        from biasclear.llm.factory import get_provider
+        from biasclear.llm.gemini import GeminiProvider
+
+        assert get_provider("gemini") is get_provider("gemini")
+        a = GeminiProvider(api_key="test-key")
+        b = GeminiProvider(api_key="test-key")
+        assert a._get_client() is b._get_client()
+
+    def test_gemini_transient_errors_classified_by_status(self):
+        from google.genai import errors
+        from biasclear.llm.gemini import _is_transient
+
+        # A 400 whose message mentions generateContent is not a rate limit
+        bad_request = errors.ClientError(400, {"error": {"message": "models/x:generateContent"}})
+        assert not _is_transient(bad_request)
+        assert _is_transient(errors.ClientError(429, {"error": {"message": "quota"}}))
+        assert _is_transient(errors.ServerError(503, {"error": {"message": "busy"}}))
+        assert _is_transient(TimeoutError("Read TIMEOUT"))
+        assert not _is_transient(ValueError("bad json"))
+
+    def test_gemini_retry_delay_honours_server_hint(self):
+        import httpx
+        from google.genai import errors
+        from biasclear.llm.gemini import _retry_delay
+
+        retry_info = {"@type": "type.googleapis.com/google.rpc.RetryInfo", "retryDelay": "12s"}
+        quota = errors.ClientError(429, {"error": {"message": "quota", "details": [retry_info]}})
+        assert _retry_delay(quota, 0) == 12.0
+        header = errors.ClientError(429, {"error": {"message": "q"}},
+                                    httpx.Response(429, headers={"Retry-After": "3"}))
+        assert _retry_delay(header, 0) >= 3.0
+        too_long = errors.ClientError(429, {"error": {"message": "q"}},
+                                      httpx.Response(429, headers={"Retry-After": "120"}))
+        assert _retry_delay(too_long, 0) is None
+        assert 1.0 <= _retry_delay(TimeoutError("timeout"), 1) <= 3.0
+
+
+class TestPackageImport:
+    """`import biasclear` stays side-effect free."""
+
+    def test_import_defers_databases_and_llm_sdks(self):
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, biasclear\n"
+            "lazy = ('biasclear.audit', 'biasclear.patterns.learned', 'biasclear.llm.gemini')\n"
+            "assert not any(m in sys.modules for m in lazy)\n"
+            "from biasclear import frozen_core, LearningRing, scan_local\n"
+            "assert type(frozen_core).__name__ == 'FrozenCore'\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
 
 
 class TestLogging:
@@ -149,3 +275,26 @@ class TestLogging:
         from biasclear.logging import get_logger
         log = get_logger("detector")
         assert log.name == "biasclear.detector"
+
+    def test_queued_records_keep_args_and_exc_info(self):
+        import logging
+        from biasclear import logging as bc_logging
+
+        captured = []
+
+        class _Capture(logging.Handler):
+            def emit(self, record):
+                captured.append(record)
+
+        bc_logging.setup_logging()
+        try:
+            # Swap the listener's stdout handler for a capturing one
+            bc_logging._listener.handlers = (_Capture(),)
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                bc_logging.get_logger("test").error("failed %s", "here", exc_info=True)
+        finally:
+            bc_logging.shutdown_logging()
+        assert captured[0].getMessage() == "failed here"
+        assert captured[0].exc_info[0] is ValueError
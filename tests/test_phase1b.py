@@ -208,6 +208,52 @@ class TestLearningRing:
         active = ring.get_active_patterns()
         assert not any(p.id == "FP_TEST" for p in active)
 
+    def test_evaluations_buffered_until_read(self, ring):
+        from unittest.mock import patch
+        ring.propose(
+            pattern_id="EVAL_TEST", name="Eval", description="Test",
+            pit_tier=1, severity="low", principle="Truth",
+            regex=r"\beval\s+test\b", source_scan_hash="scan0",
+        )
+        with patch.object(ring, "_get_conn", wraps=ring._get_conn) as conns:
+            for _ in range(5):
+                ring.record_evaluation("EVAL_TEST")
+            assert conns.call_count == 0
+        assert ring.get_all_patterns()[0]["total_evaluations"] == 5
+
+    def test_active_snapshot_versioned(self, ring):
+        """Active patterns are served from a snapshot invalidated on activation."""
+        v0 = ring.version
+        first = ring.get_active_patterns()
+        assert ring.get_active_patterns() is first
+
+        for i in range(3):
+            ring.propose(
+                pattern_id="SNAPSHOT_TEST", name="Snapshot", description="Test",
+                pit_tier=1, severity="low", principle="Truth",
+                regex=r"\bsnapshot\b", source_scan_hash=f"scan{i}",
+            )
+        assert ring.version > v0
+        assert [p.id for p in ring.get_active_patterns()] == ["SNAPSHOT_TEST"]
+
+    def test_status_counts_track_transitions(self, ring):
+        """Cached status counts follow proposal and activation."""
+        assert ring.get_status_counts()["staging"] == 0
+        ring.propose(
+            pattern_id="COUNT_TEST", name="Count", description="Test",
+            pit_tier=1, severity="low", principle="Truth",
+            regex=r"\bcount\b", source_scan_hash="scan0",
+        )
+        assert ring.get_status_counts()["staging"] == 1
+        for i in range(1, 3):
+            ring.propose(
+                pattern_id="COUNT_TEST", name="Count", description="Test",
+                pit_tier=1, severity="low", principle="Truth",
+                regex=r"\bcount\b", source_scan_hash=f"scan{i}",
+            )
+        counts = ring.get_status_counts()
+        assert (counts["staging"], counts["active"]) == (0, 1)
+
     def test_audit_logger_called(self, ring):
         """Audit logger should be called on state transitions."""
         logged = []
@@ -233,6 +279,36 @@ class TestLearningRing:
         assert patterns[0]["status"] == "staging"
         assert patterns[0]["pit_tier"] == 2
 
+    def test_database_uses_wal(self, ring):
+        conn = ring._get_conn()
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+    def test_status_and_listing_queries_use_indexes(self, ring):
+        conn = ring._get_conn()
+        plans = {
+            sql: " ".join(row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql))
+            for sql in (
+                "SELECT regex FROM learned_patterns WHERE status = 'active'",
+                "SELECT status, COUNT(*) FROM learned_patterns GROUP BY status",
+                "SELECT pattern_id FROM learned_patterns ORDER BY proposed_at DESC",
+            )
+        }
+        for sql, plan in plans.items():
+            assert "INDEX idx_lp_" in plan, (sql, plan)
+
+    def test_connection_reused_per_thread(self, ring):
+        import threading
+        conn = ring._get_conn()
+        assert ring._get_conn() is conn
+        other = []
+        t = threading.Thread(target=lambda: other.append(ring._get_conn()))
+        t.start()
+        t.join()
+        assert other[0] is not conn
+        ring.close_connections()
+        assert ring._get_conn() is not conn
+
 
 # ============================================================
 # PATTERN PROPOSER — VALIDATION LOGIC
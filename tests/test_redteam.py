@@ -28,12 +28,10 @@ def client():
 @pytest.fixture(autouse=True)
 def reset_rate_limits():
     """Reset rate limiter state between tests."""
-    from biasclear.rate_limit import _windows, _lock
-    with _lock:
-        _windows.clear()
+    from biasclear.rate_limit import _clear_buckets
+    _clear_buckets()
     yield
-    with _lock:
-        _windows.clear()
+    _clear_buckets()
 
 
 # ============================================================
@@ -198,6 +196,27 @@ class TestReDoSProtection:
         result = _regex_with_timeout("[invalid", "test text", timeout=2)
         assert result == []
 
+    def test_only_learned_regexes_run_under_timeout_guard(self):
+        """Vetted frozen indicators run inline; learned ones keep the guard."""
+        import sys
+        from unittest.mock import patch
+        from biasclear.frozen_core import frozen_core, StructuralPattern
+
+        core_mod = sys.modules["biasclear.frozen_core"]
+
+        learned = StructuralPattern(
+            id="LEARNED_GUARD", name="Guard", description="Test", pit_tier=1,
+            severity="low", principle="Truth", indicators=[r"\bguard\s+probe\b"],
+            min_matches=1,
+        )
+        with patch.object(core_mod, "_regex_with_timeout",
+                          wraps=core_mod._regex_with_timeout) as guarded:
+            result = frozen_core.evaluate(
+                "All experts agree. Guard probe here.", external_patterns=[learned],
+            )
+        assert [c.args[0] for c in guarded.call_args_list] == [r"\bguard\s+probe\b"]
+        assert "LEARNED_GUARD" in {f.pattern_id for f in result.flags}
+
 
 # ============================================================
 # BATCH FLOOD PROTECTION
@@ -238,45 +257,36 @@ class TestBatchFlood:
 # ============================================================
 
 class TestRateLimitHourlyWindow:
-    """Verify hourly rate limit survives the per-minute check."""
-
-    def test_hourly_count_persists_after_minute_check(self):
-        """Timestamps older than 60s must survive count_within(60)."""
-        from biasclear.rate_limit import RateWindow
-        window = RateWindow()
-
-        now = time.time()
-        window.timestamps = [
-            now - 120,  # 2 minutes ago
-            now - 90,   # 90s ago
-            now - 30,   # 30s ago
-            now - 10,   # 10s ago
-            now,
-        ]
-
-        minute_count = window.count_within(60)
-        assert minute_count == 3
-
-        hour_count = window.count_within(3600)
-        assert hour_count == 5, (
-            "Hourly count should include all 5 timestamps — "
-            "count_within must not mutate the list"
+    """Verify the hourly budget survives per-minute refills."""
+
+    def test_hourly_budget_persists_after_minute_refill(self):
+        """A full minute bucket must not mask an exhausted hourly budget."""
+        from biasclear.rate_limit import TokenBucket, RateLimits
+        limits = RateLimits(per_minute=10, per_hour=100)
+        bucket = TokenBucket(limits, minute_tokens=0.0, hour_tokens=0.0)
+
+        bucket.refill(bucket.last + 120)  # Two minutes idle
+        assert bucket.minute_tokens == 10
+        assert bucket.hour_tokens == pytest.approx(120 * 100 / 3600), (
+            "Two idle minutes refill the minute bucket but earn only "
+            "~3.3 hourly tokens"
         )
 
-    def test_trim_only_happens_in_record(self):
-        """Trimming should only happen in record(), not in count_within()."""
-        from biasclear.rate_limit import RateWindow
-        window = RateWindow()
-
-        now = time.time()
-        window.timestamps = [now - 7200, now - 3601, now - 30, now]
-
-        original_len = len(window.timestamps)
-        window.count_within(60)
-        assert len(window.timestamps) == original_len
-
-        window.count_within(3600)
-        assert len(window.timestamps) == original_len
+    def test_exhausted_hour_budget_rejects(self):
+        """check_rate_limit must reject on the hourly bucket alone."""
+        from biasclear.rate_limit import (
+            check_rate_limit, RateLimits, TokenBucket, _shard_for,
+        )
+        from fastapi import HTTPException
+        limits = RateLimits(per_minute=10, per_hour=100)
+        shard = _shard_for("hourly_key")
+        with shard.lock:
+            shard.buckets["hourly_key"] = TokenBucket(limits, minute_tokens=10.0, hour_tokens=0.0)
+
+        with pytest.raises(HTTPException) as exc_info:
+            check_rate_limit("hourly_key", limits)
+        assert exc_info.value.status_code == 429
+        assert "hour" in exc_info.value.detail
 
 
 # ============================================================
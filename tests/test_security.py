@@ -132,17 +132,16 @@ class TestIPRateLimiting:
 
     def test_ip_rate_limit_enforced(self):
         from biasclear.rate_limit import (
-            check_rate_limit, RateLimits, _windows, _lock,
+            check_rate_limit, RateLimits, _hash_ip, _shard_for,
         )
         from fastapi import HTTPException
 
-        # Clean state
+        # Clean state — remove any existing bucket for this IP hash
         test_ip = "192.168.99.99"
-        with _lock:
-            # Remove any existing window for this IP hash
-            from biasclear.rate_limit import _hash_ip
-            ip_key = _hash_ip(test_ip)
-            _windows.pop(ip_key, None)
+        ip_key = _hash_ip(test_ip)
+        shard = _shard_for(ip_key)
+        with shard.lock:
+            shard.buckets.pop(ip_key, None)
 
         # Should allow under limit
         limits = RateLimits(per_minute=3, per_hour=100)
@@ -155,6 +154,44 @@ class TestIPRateLimiting:
         assert exc_info.value.status_code == 429
 
 
+# ============================================================
+# BODY SIZE LIMIT
+# ============================================================
+
+class TestBodySizeLimit:
+    """Verify oversized bodies are rejected with or without Content-Length."""
+
+    def test_declared_length_over_limit(self, client):
+        res = client.post("/scan", content=b"x" * (1_048_576 + 1),
+                          headers={"Content-Type": "application/json"})
+        assert res.status_code == 413
+
+    def test_chunked_body_over_limit(self, client):
+        def chunks():
+            for _ in range(17):
+                yield b"x" * 65536
+        res = client.post("/scan", content=chunks(),
+                          headers={"Content-Type": "application/json"})
+        assert res.status_code == 413
+
+    def test_chunked_overflow_wins_over_route_error_handling(self, client):
+        """Routes that swallow read errors still can't answer an oversized body."""
+        def chunks():
+            for _ in range(17):
+                yield b"x" * 65536
+        res = client.post("/beta-signup", content=chunks(),
+                          headers={"Content-Type": "application/x-www-form-urlencoded"})
+        assert res.status_code == 413
+
+    def test_chunked_body_under_limit_reaches_route(self, client):
+        import json
+        payload = json.dumps({"text": "Test.", "mode": "local", "domain": "general"}).encode()
+        res = client.post("/scan", content=iter([payload[:10], payload[10:]]),
+                          headers={"Content-Type": "application/json"})
+        assert res.status_code == 200
+        assert res.json()["text"] == "Test."
+
+
 # ============================================================
 # SECURITY HEADERS
 # ============================================================
@@ -201,6 +238,50 @@ class TestSecurityHeaders:
         res = client.get("/health")
         assert res.headers.get("x-permitted-cross-domain-policies") == "none"
 
+    def test_headers_added_once_per_response(self, client):
+        for _ in range(3):
+            res = client.get("/health")
+        assert res.headers.get_list("x-frame-options") == ["DENY"]
+        assert len(res.headers.get_list("x-request-id")) == 1
+
+    def test_static_assets_keep_security_headers(self, client):
+        """Static assets skip request-ID/body middleware but not security headers."""
+        res = client.get("/static/privacy.html")
+        assert res.status_code == 200
+        assert res.headers.get("x-content-type-options") == "nosniff"
+        assert "x-request-id" not in res.headers
+
+
+class TestCORS:
+    """Verify the CORS allowlist is parsed once into a set."""
+
+    def test_origins_are_a_frozenset_without_blanks(self):
+        from api.main import _CORS_ORIGINS
+        assert isinstance(_CORS_ORIGINS, frozenset)
+        assert "" not in _CORS_ORIGINS
+
+    def test_wildcard_origins_compile_to_regex(self):
+        import re
+        from api.main import _parse_cors_origins
+        origins, regex = _parse_cors_origins(
+            "https://biasclear.com, https://*.biasclear.com,,"
+        )
+        assert origins == frozenset({"https://biasclear.com"})
+        assert re.fullmatch(regex, "https://app.biasclear.com")
+        assert not re.fullmatch(regex, "https://evil.com/.biasclear.com")
+        assert not re.fullmatch(regex, "https://app.biasclear.com.evil.com")
+        assert _parse_cors_origins("*") == (frozenset({"*"}), None)
+
+    def test_preflight_from_allowed_origin(self, client):
+        from api.main import _CORS_ORIGINS
+        origin = "https://example.com" if "*" in _CORS_ORIGINS else next(iter(_CORS_ORIGINS))
+        res = client.options("/scan", headers={
+            "Origin": origin,
+            "Access-Control-Request-Method": "POST",
+        })
+        assert res.status_code == 200
+        assert res.headers.get("access-control-allow-origin") in ("*", origin)
+
 
 # ============================================================
 # REQUEST ID TRACING